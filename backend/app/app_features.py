@@ -5,20 +5,20 @@ Provides endpoints for TAH (Tenant Access Hub) to discover
 and manage application features for permission management.
 """
 import logging
-from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
-from sqlalchemy import select, delete
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .cache import get_response_cache
 from .database import get_session
 from .models import AppFeature
-from .config import get_settings
 
 logger = logging.getLogger("dcp.app_features")
-settings = get_settings()
 
 router = APIRouter(tags=["app-features"])
 
@@ -28,6 +28,12 @@ APP_NAME = "Decision Control Plane"
 APP_VERSION = "2.0.0"
 APP_DESCRIPTION = "Human-in-the-loop decision management system for AI orchestration"
 
+# Response cache for the read endpoints, invalidated on every mutation.
+# Aggregates change less often than feature payloads, so they live longer.
+CACHE_NAMESPACE = "app_features"
+FEATURES_CACHE_TTL_SECONDS = 30
+STATS_CACHE_TTL_SECONDS = 60
+
 
 # Pydantic Schemas
 class AppFeatureIn(BaseModel):
@@ -55,8 +61,10 @@ class AppFeatureOut(BaseModel):
     requiresOrg: bool
     metadata: Optional[dict[str, Any]]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+FEATURE_LIST_ADAPTER = TypeAdapter(list[AppFeatureOut])
 
 
 class ModuleInfo(BaseModel):
@@ -65,6 +73,9 @@ class ModuleInfo(BaseModel):
     featureCount: int
 
 
+MODULE_LIST_ADAPTER = TypeAdapter(list[ModuleInfo])
+
+
 class ManifestStats(BaseModel):
     totalFeatures: int
     totalModules: int
@@ -81,8 +92,8 @@ class AppManifest(BaseModel):
     stats: ManifestStats
 
 
-# Default Features for DCP
-DEFAULT_FEATURES = [
+# Default Features for DCP, as insert-ready column dicts
+DEFAULT_FEATURE_ROWS: tuple[dict[str, Any], ...] = (
     {
         "id": "dcp.dashboard",
         "name": "Dashboard",
@@ -91,8 +102,8 @@ DEFAULT_FEATURES = [
         "path": "/",
         "icon": "LayoutDashboard",
         "actions": ["read"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.decisions",
@@ -102,8 +113,8 @@ DEFAULT_FEATURES = [
         "path": "/decisions",
         "icon": "CheckCircle",
         "actions": ["read", "update"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.decisions.approve",
@@ -113,8 +124,8 @@ DEFAULT_FEATURES = [
         "path": "/decisions/:id/approve",
         "icon": "Check",
         "actions": ["execute"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.decisions.reject",
@@ -124,8 +135,8 @@ DEFAULT_FEATURES = [
         "path": "/decisions/:id/reject",
         "icon": "X",
         "actions": ["execute"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.decisions.escalate",
@@ -135,8 +146,8 @@ DEFAULT_FEATURES = [
         "path": "/decisions/:id/escalate",
         "icon": "ArrowUp",
         "actions": ["execute"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.decisions.modify",
@@ -146,8 +157,8 @@ DEFAULT_FEATURES = [
         "path": "/decisions/:id/modify",
         "icon": "Edit",
         "actions": ["execute"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.policy",
@@ -157,8 +168,8 @@ DEFAULT_FEATURES = [
         "path": "/policy",
         "icon": "Shield",
         "actions": ["read", "create", "update", "delete"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.policy.evaluate",
@@ -168,8 +179,8 @@ DEFAULT_FEATURES = [
         "path": "/policy/evaluate",
         "icon": "PlayCircle",
         "actions": ["execute"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.api.gates",
@@ -179,8 +190,8 @@ DEFAULT_FEATURES = [
         "path": "/api/v2/dcp/decision-gates",
         "icon": "Zap",
         "actions": ["create"],
-        "is_public": "false",
-        "requires_org": "true",
+        "is_public": False,
+        "requires_org": True,
     },
     {
         "id": "dcp.metrics",
@@ -190,8 +201,8 @@ DEFAULT_FEATURES = [
         "path": "/metrics",
         "icon": "BarChart",
         "actions": ["read"],
-        "is_public": "true",
-        "requires_org": "false",
+        "is_public": True,
+        "requires_org": False,
     },
     {
         "id": "dcp.health",
@@ -201,10 +212,25 @@ DEFAULT_FEATURES = [
         "path": "/healthz",
         "icon": "Heart",
         "actions": ["read"],
-        "is_public": "true",
-        "requires_org": "false",
+        "is_public": True,
+        "requires_org": False,
     },
-]
+)
+DEFAULT_FEATURE_IDS: tuple[str, ...] = tuple(f["id"] for f in DEFAULT_FEATURE_ROWS)
+
+# Statements built once at import; per-request work is parameter binding only
+SELECT_ALL_FEATURES = select(AppFeature)
+SELECT_FEATURE_BY_ID = select(AppFeature).where(AppFeature.id == bindparam("feature_id"))
+SELECT_DEFAULT_FEATURES = select(AppFeature).where(AppFeature.id.in_(DEFAULT_FEATURE_IDS))
+SELECT_MODULE_STATS = (
+    select(
+        AppFeature.module,
+        func.count(),
+        func.count().filter(AppFeature.is_public),
+    )
+    .group_by(AppFeature.module)
+    .order_by(AppFeature.module)
+)
 
 
 def feature_to_out(feature: AppFeature) -> AppFeatureOut:
@@ -217,41 +243,60 @@ def feature_to_out(feature: AppFeature) -> AppFeatureOut:
         path=feature.path,
         icon=feature.icon,
         actions=feature.actions or [],
-        isPublic=feature.is_public == "true",
-        requiresOrg=feature.requires_org == "true",
+        isPublic=feature.is_public,
+        requiresOrg=feature.requires_org,
         metadata=feature.extra_data,
     )
 
 
-@router.get("/manifest", response_model=AppManifest)
-async def get_manifest(session: AsyncSession = Depends(get_session)):
-    """
-    Get the complete application manifest with all features.
-    This endpoint is PUBLIC and used by TAH to discover app features.
-    """
-    result = await session.execute(select(AppFeature))
-    features = result.scalars().all()
+def feature_values(payload: AppFeatureIn) -> dict[str, Any]:
+    """Map an input payload to AppFeature column values (excluding id)."""
+    return {
+        "name": payload.name,
+        "description": payload.description,
+        "module": payload.module,
+        "path": payload.path,
+        "icon": payload.icon,
+        "actions": payload.actions,
+        "is_public": payload.is_public,
+        "requires_org": payload.requires_org,
+        "extra_data": payload.metadata,
+    }
 
-    # If no features, seed with defaults
-    if not features:
-        await seed_features_internal(session)
-        result = await session.execute(select(AppFeature))
-        features = result.scalars().all()
 
-    feature_outs = [feature_to_out(f) for f in features]
+async def invalidate_features_cache() -> None:
+    """Drop cached manifest and feature list after a mutation."""
+    await get_response_cache().clear(CACHE_NAMESPACE)
 
-    # Group by module
-    modules_dict: dict[str, int] = {}
+
+async def load_module_stats(session: AsyncSession) -> tuple[list[ModuleInfo], ManifestStats]:
+    """Load per-module feature counts and totals, aggregated by the database."""
+    result = await session.execute(SELECT_MODULE_STATS)
+    modules = []
+    total_count = 0
     public_count = 0
-    for f in feature_outs:
-        modules_dict[f.module] = modules_dict.get(f.module, 0) + 1
-        if f.isPublic:
-            public_count += 1
+    for module, feature_count, module_public in result.all():
+        modules.append(ModuleInfo(id=module, name=module.title(), featureCount=feature_count))
+        total_count += feature_count
+        public_count += module_public or 0
+
+    stats = ManifestStats(
+        totalFeatures=total_count,
+        totalModules=len(modules),
+        publicFeatures=public_count,
+    )
+    return modules, stats
 
-    modules = [
-        ModuleInfo(id=m, name=m.title(), featureCount=c)
-        for m, c in modules_dict.items()
-    ]
+
+async def build_manifest(session: AsyncSession) -> AppManifest:
+    """Build the application manifest from the database."""
+    result = await session.execute(SELECT_ALL_FEATURES)
+    features = result.scalars().all()
+
+    # If no features, seed with defaults and reuse the seeded rows
+    features = features or await seed_features_internal(session)
+
+    modules, stats = await load_module_stats(session)
 
     return AppManifest(
         appId=APP_ID,
@@ -259,27 +304,75 @@ async def get_manifest(session: AsyncSession = Depends(get_session)):
         version=APP_VERSION,
         description=APP_DESCRIPTION,
         modules=modules,
-        features=feature_outs,
-        stats=ManifestStats(
-            totalFeatures=len(feature_outs),
-            totalModules=len(modules),
-            publicFeatures=public_count,
-        ),
+        features=[feature_to_out(f) for f in features],
+        stats=stats,
     )
 
 
-@router.get("/", response_model=list[AppFeatureOut])
+@router.get("/manifest", response_model=AppManifest, response_class=ORJSONResponse)
+async def get_manifest(session: AsyncSession = Depends(get_session)):
+    """
+    Get the complete application manifest with all features.
+    This endpoint is PUBLIC and used by TAH to discover app features.
+    """
+    async def build() -> bytes:
+        manifest = await build_manifest(session)
+        return manifest.model_dump_json().encode()
+
+    # Cached bytes are already JSON, so they are sent as-is without re-encoding
+    payload = await get_response_cache().get_or_set(
+        CACHE_NAMESPACE, "manifest", FEATURES_CACHE_TTL_SECONDS, build
+    )
+    return Response(content=payload, media_type=ORJSONResponse.media_type)
+
+
+@router.get("/manifest/stats", response_model=ManifestStats, response_class=ORJSONResponse)
+async def get_manifest_stats(session: AsyncSession = Depends(get_session)):
+    """
+    Get only the manifest stats block.
+    Lets TAH check the app without downloading every feature.
+    """
+    async def build() -> bytes:
+        _, stats = await load_module_stats(session)
+        return stats.model_dump_json().encode()
+
+    payload = await get_response_cache().get_or_set(
+        CACHE_NAMESPACE, "manifest:stats", STATS_CACHE_TTL_SECONDS, build
+    )
+    return Response(content=payload, media_type=ORJSONResponse.media_type)
+
+
+@router.get("/manifest/modules", response_model=list[ModuleInfo], response_class=ORJSONResponse)
+async def get_manifest_modules(session: AsyncSession = Depends(get_session)):
+    """Get only the manifest module list with per-module feature counts."""
+    async def build() -> bytes:
+        modules, _ = await load_module_stats(session)
+        return MODULE_LIST_ADAPTER.dump_json(modules)
+
+    payload = await get_response_cache().get_or_set(
+        CACHE_NAMESPACE, "manifest:modules", STATS_CACHE_TTL_SECONDS, build
+    )
+    return Response(content=payload, media_type=ORJSONResponse.media_type)
+
+
+@router.get("/", response_model=list[AppFeatureOut], response_class=ORJSONResponse)
 async def list_features(session: AsyncSession = Depends(get_session)):
     """List all app features."""
-    result = await session.execute(select(AppFeature))
-    features = result.scalars().all()
-    return [feature_to_out(f) for f in features]
+    async def build() -> bytes:
+        result = await session.execute(SELECT_ALL_FEATURES)
+        features = result.scalars().all()
+        return FEATURE_LIST_ADAPTER.dump_json([feature_to_out(f) for f in features])
+
+    payload = await get_response_cache().get_or_set(
+        CACHE_NAMESPACE, "list", FEATURES_CACHE_TTL_SECONDS, build
+    )
+    return Response(content=payload, media_type=ORJSONResponse.media_type)
 
 
-@router.get("/{feature_id}", response_model=AppFeatureOut)
+@router.get("/{feature_id}", response_model=AppFeatureOut, response_class=ORJSONResponse)
 async def get_feature(feature_id: str, session: AsyncSession = Depends(get_session)):
     """Get a specific feature by ID."""
-    result = await session.execute(select(AppFeature).where(AppFeature.id == feature_id))
+    result = await session.execute(SELECT_FEATURE_BY_ID, {"feature_id": feature_id})
     feature = result.scalar_one_or_none()
     if not feature:
         raise HTTPException(status_code=404, detail="Feature not found")
@@ -292,26 +385,19 @@ async def create_feature(
     session: AsyncSession = Depends(get_session),
 ):
     """Create a new app feature."""
-    # Check if exists
-    existing = await session.execute(select(AppFeature).where(AppFeature.id == payload.id))
-    if existing.scalar_one_or_none():
+    # Single round trip; a conflicting id returns no row instead of racing a SELECT
+    result = await session.execute(
+        pg_insert(AppFeature)
+        .values(id=payload.id, **feature_values(payload))
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(AppFeature)
+    )
+    feature = result.scalar_one_or_none()
+    if feature is None:
         raise HTTPException(status_code=409, detail="Feature already exists")
 
-    feature = AppFeature(
-        id=payload.id,
-        name=payload.name,
-        description=payload.description,
-        module=payload.module,
-        path=payload.path,
-        icon=payload.icon,
-        actions=payload.actions,
-        is_public="true" if payload.is_public else "false",
-        requires_org="true" if payload.requires_org else "false",
-        extra_data=payload.metadata,
-    )
-    session.add(feature)
     await session.commit()
-    await session.refresh(feature)
+    await invalidate_features_cache()
     logger.info(f"Created app feature: {feature.id}")
     return feature_to_out(feature)
 
@@ -323,24 +409,18 @@ async def update_feature(
     session: AsyncSession = Depends(get_session),
 ):
     """Update an existing app feature."""
-    result = await session.execute(select(AppFeature).where(AppFeature.id == feature_id))
+    result = await session.execute(
+        update(AppFeature)
+        .where(AppFeature.id == feature_id)
+        .values(**feature_values(payload), updated_at=func.now())
+        .returning(AppFeature)
+    )
     feature = result.scalar_one_or_none()
-    if not feature:
+    if feature is None:
         raise HTTPException(status_code=404, detail="Feature not found")
 
-    feature.name = payload.name
-    feature.description = payload.description
-    feature.module = payload.module
-    feature.path = payload.path
-    feature.icon = payload.icon
-    feature.actions = payload.actions
-    feature.is_public = "true" if payload.is_public else "false"
-    feature.requires_org = "true" if payload.requires_org else "false"
-    feature.extra_data = payload.metadata
-    feature.updated_at = datetime.utcnow()
-
     await session.commit()
-    await session.refresh(feature)
+    await invalidate_features_cache()
     logger.info(f"Updated app feature: {feature.id}")
     return feature_to_out(feature)
 
@@ -348,35 +428,48 @@ async def update_feature(
 @router.delete("/{feature_id}", status_code=204)
 async def delete_feature(feature_id: str, session: AsyncSession = Depends(get_session)):
     """Delete an app feature."""
-    result = await session.execute(select(AppFeature).where(AppFeature.id == feature_id))
+    result = await session.execute(SELECT_FEATURE_BY_ID, {"feature_id": feature_id})
     feature = result.scalar_one_or_none()
     if not feature:
         raise HTTPException(status_code=404, detail="Feature not found")
 
     await session.delete(feature)
     await session.commit()
+    await invalidate_features_cache()
     logger.info(f"Deleted app feature: {feature_id}")
 
 
-async def seed_features_internal(session: AsyncSession):
-    """Internal function to seed default features."""
-    for feat_data in DEFAULT_FEATURES:
-        existing = await session.execute(
-            select(AppFeature).where(AppFeature.id == feat_data["id"])
+async def seed_features_internal(session: AsyncSession) -> list[AppFeature]:
+    """
+    Internal function to seed default features.
+
+    Returns the default feature rows, both pre-existing and newly created.
+    """
+    result = await session.execute(SELECT_DEFAULT_FEATURES)
+    features = list(result.scalars().all())
+    existing_ids = {f.id for f in features}
+
+    rows = [f for f in DEFAULT_FEATURE_ROWS if f["id"] not in existing_ids]
+    if rows:
+        result = await session.execute(
+            pg_insert(AppFeature)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(AppFeature)
         )
-        if not existing.scalar_one_or_none():
-            feature = AppFeature(**feat_data)
-            session.add(feature)
+        features.extend(result.scalars().all())
 
     await session.commit()
-    logger.info(f"Seeded {len(DEFAULT_FEATURES)} default features")
+    await invalidate_features_cache()
+    logger.info(f"Seeded {len(rows)} of {len(DEFAULT_FEATURE_ROWS)} default features")
+    return features
 
 
 @router.post("/seed", status_code=201)
 async def seed_features(session: AsyncSession = Depends(get_session)):
     """Seed default features for the application."""
     await seed_features_internal(session)
-    return {"message": f"Seeded {len(DEFAULT_FEATURES)} features", "features": len(DEFAULT_FEATURES)}
+    return {"message": f"Seeded {len(DEFAULT_FEATURE_ROWS)} features", "features": len(DEFAULT_FEATURE_ROWS)}
 
 
 @router.delete("/", status_code=204)
@@ -384,4 +477,5 @@ async def clear_features(session: AsyncSession = Depends(get_session)):
     """Clear all features (admin only - use with caution)."""
     await session.execute(delete(AppFeature))
     await session.commit()
+    await invalidate_features_cache()
     logger.warning("Cleared all app features")
@@ -7,20 +7,26 @@ following the TAH v2.0 integration specification.
 import hashlib
 import logging
 import secrets
+import time
+from collections import OrderedDict
 from contextvars import ContextVar
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from functools import wraps
-from typing import List, Optional
+from typing import Any, List, Optional
+from uuid import UUID
 
 import jwt
 from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse
 from jwt import PyJWKClient
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from .cache import TTLCache
 from .config import get_settings
 from .database import get_session
 from .models import User, UserSession
@@ -40,6 +46,17 @@ class TAHUserInfo:
 logger = logging.getLogger("dcp.auth")
 settings = get_settings()
 
+# Lifetime of sessions created by tah_callback
+SESSION_TTL = timedelta(hours=settings.session_expire_hours)
+
+# TAH token decode settings, shared by every validate() call
+JWT_ALGORITHMS = ("RS256",)
+JWT_DECODE_OPTIONS = {"require": ["exp", "iat", "sub", "aud", "iss"]}
+
+# Validated TAH tokens by digest, so repeat bearer requests skip signature
+# verification; entries are never served past the token's own exp
+TOKEN_CACHE = TTLCache(maxsize=10_000, ttl=60)
+
 # Context variable for current org_id
 current_org_id: ContextVar[Optional[str]] = ContextVar("current_org_id", default=None)
 current_user_id: ContextVar[Optional[str]] = ContextVar("current_user_id", default=None)
@@ -63,16 +80,27 @@ class TAHTokenPayload:
     aud: str
 
 
+def hash_session_token(session_token: str) -> bytes:
+    """Hash a session token into the 32-byte digest stored in user_sessions."""
+    if settings.session_token_hash == "sha256":
+        return hashlib.sha256(session_token.encode()).digest()
+    return hashlib.blake2b(session_token.encode(), digest_size=32).digest()
+
+
 class TAHTokenValidator:
     """Validates TAH JWT tokens using JWKS."""
 
     _instance: Optional["TAHTokenValidator"] = None
 
+    # Max number of resolved signing keys kept per validator (keyed by kid)
+    KEY_CACHE_SIZE = 16
+
     def __init__(self, jwks_url: str, issuer: str, audience: str):
         self.jwks_url = jwks_url
         self.jwks_client = PyJWKClient(jwks_url, cache_keys=True, lifespan=300)  # 5 min cache
         self.issuer = issuer
         self.audience = audience
+        self._key_cache: OrderedDict[str, Any] = OrderedDict()
         logger.info(f"TAHTokenValidator initialized: jwks_url={jwks_url}, issuer={issuer}, audience={audience}")
 
     @classmethod
@@ -92,23 +120,42 @@ class TAHTokenValidator:
         cls._instance = None
         logger.info("TAHTokenValidator instance reset")
 
+    def _get_signing_key(self, token: str, kid: Optional[str]) -> Any:
+        """Resolve the signing key for a token, memoized by kid."""
+        if kid is not None and kid in self._key_cache:
+            self._key_cache.move_to_end(kid)
+            return self._key_cache[kid]
+
+        signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+        logger.info(f"Found signing key: kid={signing_key.key_id}")
+
+        if kid is not None:
+            self._key_cache[kid] = signing_key.key
+            if len(self._key_cache) > self.KEY_CACHE_SIZE:
+                self._key_cache.popitem(last=False)
+        return signing_key.key
+
     def validate(self, token: str, retry_on_signature_fail: bool = True) -> TAHTokenPayload:
         """Validate JWT token and return payload."""
+        token_key = hash_session_token(token)
+        cached = TOKEN_CACHE.get(token_key)
+        if cached is not None and cached.exp > time.time():
+            return cached
+
         try:
             # Decode header to log kid
             header = jwt.get_unverified_header(token)
             logger.info(f"Token header: alg={header.get('alg')}, kid={header.get('kid')}")
 
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
-            logger.info(f"Found signing key: kid={signing_key.key_id}")
+            signing_key = self._get_signing_key(token, header.get("kid"))
 
             payload = jwt.decode(
                 token,
-                signing_key.key,
-                algorithms=["RS256"],
+                signing_key,
+                algorithms=JWT_ALGORITHMS,
                 audience=self.audience,
                 issuer=self.issuer,
-                options={"require": ["exp", "iat", "sub", "aud", "iss"]}
+                options=JWT_DECODE_OPTIONS,
             )
 
             # Validate required fields
@@ -116,7 +163,7 @@ class TAHTokenValidator:
                 raise ValueError("Missing org_id in token")
 
             logger.info(f"Token validated successfully for user: {payload.get('email')}")
-            return TAHTokenPayload(
+            token_payload = TAHTokenPayload(
                 sub=payload["sub"],
                 email=payload.get("email", ""),
                 name=payload.get("name"),
@@ -129,6 +176,8 @@ class TAHTokenValidator:
                 iss=payload["iss"],
                 aud=payload["aud"],
             )
+            TOKEN_CACHE.set(token_key, token_payload)
+            return token_payload
         except jwt.ExpiredSignatureError:
             raise ValueError("Token has expired")
         except jwt.InvalidAudienceError:
@@ -139,8 +188,9 @@ class TAHTokenValidator:
             # Signature failed - try refreshing JWKS cache
             if retry_on_signature_fail:
                 logger.warning(f"Signature verification failed, refreshing JWKS cache and retrying...")
-                # Create new client to force JWKS refresh
+                # Create new client and drop memoized keys to force JWKS refresh
                 self.jwks_client = PyJWKClient(self.jwks_url, cache_keys=True, lifespan=300)
+                self._key_cache.clear()
                 return self.validate(token, retry_on_signature_fail=False)
             raise ValueError(f"Signature verification failed: {e}")
         except Exception as e:
@@ -159,32 +209,115 @@ class SessionInfo(BaseModel):
     tenant_id: Optional[str]
 
 
+@dataclass(frozen=True)
+class ActiveSession:
+    """Immutable snapshot of a validated session, safe to cache across requests."""
+    id: UUID
+    user_id: UUID
+    org_id: str
+    token_hash: bytes
+    tah_roles: tuple[str, ...]
+    tah_permissions: tuple[str, ...]
+    tenant_id: Optional[str]
+    expires_at: datetime
+    # Set views of the tuples above for O(1) permission and role checks
+    permission_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    role_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "permission_set", frozenset(self.tah_permissions))
+        object.__setattr__(self, "role_set", frozenset(self.tah_roles))
+
+    @classmethod
+    def from_model(cls, user_session: UserSession) -> "ActiveSession":
+        expires_at = user_session.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return cls(
+            id=user_session.id,
+            user_id=user_session.user_id,
+            org_id=user_session.org_id,
+            token_hash=user_session.token_hash,
+            tah_roles=tuple(user_session.tah_roles or ()),
+            tah_permissions=tuple(user_session.tah_permissions or ()),
+            tenant_id=user_session.tenant_id,
+            expires_at=expires_at,
+        )
+
+    def is_expired(self) -> bool:
+        return self.expires_at <= datetime.now(UTC)
+
+
+# Active session lookup by cookie token hash, built once at import
+SELECT_LIVE_SESSION = (
+    select(UserSession)
+    .where(UserSession.token_hash == bindparam("token_hash"))
+    .where(UserSession.expires_at > bindparam("now"))
+    .where(UserSession.revoked_at.is_(None))
+)
+SELECT_LIVE_SESSION_WITH_USER = SELECT_LIVE_SESSION.options(joinedload(UserSession.user))
+
+# Validated sessions by token hash, per worker process. Logout pops the entry
+# only in the worker that served it: a session revoked on one worker (or
+# directly in the database) stays usable on the others for up to the TTL,
+# so keep it short.
+SESSION_CACHE = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _set_session_context(org_id: str, user_id: UUID) -> None:
+    current_org_id.set(org_id)
+    current_user_id.set(str(user_id))
+
+
+async def _fetch_active_session(
+    db: AsyncSession,
+    token_hash: bytes,
+    with_user: bool = False,
+) -> tuple[UserSession, ActiveSession]:
+    """Load an active session row by token hash and cache its snapshot."""
+    stmt = SELECT_LIVE_SESSION_WITH_USER if with_user else SELECT_LIVE_SESSION
+    result = await db.execute(stmt, {"token_hash": token_hash, "now": datetime.now(UTC)})
+    user_session = result.scalar_one_or_none()
+
+    if not user_session:
+        raise HTTPException(status_code=401, detail="Session expired or invalid")
+
+    active_session = ActiveSession.from_model(user_session)
+    SESSION_CACHE.set(token_hash, active_session)
+    _set_session_context(user_session.org_id, user_session.user_id)
+    return user_session, active_session
+
+
 async def get_current_session(
     request: Request,
     session_token: Optional[str] = Cookie(default=None, alias="session"),
     db: AsyncSession = Depends(get_session),
-) -> UserSession:
-    """Get current authenticated session from cookie."""
+) -> ActiveSession:
+    """Get current authenticated session from cookie, served from cache when possible."""
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    token_hash = hashlib.sha256(session_token.encode()).hexdigest()
+    token_hash = hash_session_token(session_token)
 
-    result = await db.execute(
-        select(UserSession)
-        .where(UserSession.token_hash == token_hash)
-        .where(UserSession.expires_at > datetime.utcnow())
-        .where(UserSession.revoked_at.is_(None))
-    )
-    user_session = result.scalar_one_or_none()
+    cached = SESSION_CACHE.get(token_hash)
+    if cached is not None and not cached.is_expired():
+        _set_session_context(cached.org_id, cached.user_id)
+        return cached
 
-    if not user_session:
-        raise HTTPException(status_code=401, detail="Session expired or invalid")
+    _, active_session = await _fetch_active_session(db, token_hash)
+    return active_session
 
-    # Set context variables
-    current_org_id.set(user_session.org_id)
-    current_user_id.set(str(user_session.user_id))
 
+async def get_current_session_with_user(
+    request: Request,
+    session_token: Optional[str] = Cookie(default=None, alias="session"),
+    db: AsyncSession = Depends(get_session),
+) -> UserSession:
+    """Get current authenticated session with its user loaded in the same query."""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    user_session, _ = await _fetch_active_session(db, hash_session_token(session_token), with_user=True)
     return user_session
 
 
@@ -192,7 +325,7 @@ async def get_optional_session(
     request: Request,
     session_token: Optional[str] = Cookie(default=None, alias="session"),
     db: AsyncSession = Depends(get_session),
-) -> Optional[UserSession]:
+) -> Optional[ActiveSession]:
     """Get current session if exists, None otherwise."""
     if not session_token:
         return None
@@ -271,12 +404,8 @@ async def get_auth_user(
     # Fall back to session cookie
     if session_token:
         try:
-            user_session = await get_current_session(request, session_token, db)
-            # Get user details from session
-            result = await db.execute(
-                select(User).where(User.id == user_session.user_id)
-            )
-            user = result.scalar_one_or_none()
+            user_session = await get_current_session_with_user(request, session_token, db)
+            user = user_session.user
             if user:
                 return TAHUserInfo(
                     user_id=str(user.id),
@@ -306,18 +435,15 @@ async def get_optional_auth_user(
         return None
 
 
-def has_permission(session: UserSession, required: str) -> bool:
+def has_permission(session: ActiveSession, required: str) -> bool:
     """Check if user has a specific permission."""
-    permissions = session.tah_permissions or []
-    if "*" in permissions:
-        return True
-    return required in permissions
+    permissions = session.permission_set
+    return "*" in permissions or required in permissions
 
 
-def has_role(session: UserSession, required: str) -> bool:
+def has_role(session: ActiveSession, required: str) -> bool:
     """Check if user has a specific role."""
-    roles = session.tah_roles or []
-    return required in roles
+    return required in session.role_set
 
 
 def require_permission(required: str):
@@ -358,45 +484,39 @@ async def tah_callback(
     # 2. Get org_id directly from token (no local org table check)
     org_id = payload.org_id
 
-    # 3. Upsert user (JIT provisioning)
-    result = await db.execute(
-        select(User).where(
-            User.tah_user_id == payload.sub,
-            User.org_id == org_id
-        )
+    # 3. Upsert user (JIT provisioning) in a single statement
+    now = datetime.now(UTC)
+    upsert = pg_insert(User).values(
+        tah_user_id=payload.sub,
+        org_id=org_id,
+        email=payload.email,
+        name=payload.name,
     )
-    user = result.scalar_one_or_none()
-
-    if not user:
-        user = User(
-            tah_user_id=payload.sub,
-            org_id=org_id,
-            email=payload.email,
-            name=payload.name,
-        )
-        db.add(user)
-        logger.info(f"Created new user: {payload.email} for org: {org_id}")
-    else:
-        user.email = payload.email
-        user.name = payload.name
-        user.last_login_at = datetime.utcnow()
-        logger.info(f"Updated user: {payload.email} for org: {org_id}")
-
-    await db.flush()
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[User.tah_user_id, User.org_id],
+        set_={
+            "email": upsert.excluded.email,
+            "name": upsert.excluded.name,
+            "last_login_at": now,
+            "updated_at": func.now(),
+        },
+    ).returning(User.id)
+    user_id = (await db.execute(upsert)).scalar_one()
+    logger.info(f"Upserted user: {payload.email} for org: {org_id}")
 
     # 4. Create session
     session_token = secrets.token_urlsafe(32)
-    token_hash = hashlib.sha256(session_token.encode()).hexdigest()
+    token_hash = hash_session_token(session_token)
 
     user_session = UserSession(
-        user_id=user.id,
+        user_id=user_id,
         org_id=org_id,
         token_hash=token_hash,
         tah_permissions=payload.permissions,
         tah_roles=payload.roles,
         tenant_id=payload.tenant_id,
-        tah_token_exp=datetime.fromtimestamp(payload.exp),
-        expires_at=datetime.utcnow() + timedelta(hours=settings.session_expire_hours),
+        tah_token_exp=datetime.fromtimestamp(payload.exp, tz=UTC),
+        expires_at=now + SESSION_TTL,
         ip_address=request.client.host if request and request.client else None,
         user_agent=request.headers.get("user-agent") if request else None,
     )
@@ -414,7 +534,7 @@ async def tah_callback(
         "httponly": True,
         "secure": settings.environment == "production",
         "samesite": "lax",
-        "max_age": settings.session_expire_hours * 3600,
+        "max_age": int(SESSION_TTL.total_seconds()),
     }
 
     # Only set domain if explicitly configured (for cross-port sharing)
@@ -429,14 +549,10 @@ async def tah_callback(
 
 @router.get("/auth/session", response_model=SessionInfo)
 async def get_session_info(
-    user_session: UserSession = Depends(get_current_session),
-    db: AsyncSession = Depends(get_session),
+    user_session: UserSession = Depends(get_current_session_with_user),
 ):
     """Get current session information."""
-    result = await db.execute(
-        select(User).where(User.id == user_session.user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = user_session.user
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -454,12 +570,17 @@ async def get_session_info(
 
 @router.post("/auth/logout")
 async def logout(
-    user_session: UserSession = Depends(get_current_session),
+    user_session: ActiveSession = Depends(get_current_session),
     db: AsyncSession = Depends(get_session),
 ):
     """Logout and revoke session."""
-    user_session.revoked_at = datetime.utcnow()
+    await db.execute(
+        update(UserSession)
+        .where(UserSession.id == user_session.id)
+        .values(revoked_at=datetime.now(UTC))
+    )
     await db.commit()
+    SESSION_CACHE.pop(user_session.token_hash, None)
 
     response = Response(content='{"success": true}', media_type="application/json")
     response.delete_cookie("session")
@@ -469,7 +590,7 @@ async def logout(
 
 @router.get("/auth/check")
 async def check_auth(
-    user_session: Optional[UserSession] = Depends(get_optional_session),
+    user_session: Optional[ActiveSession] = Depends(get_optional_session),
 ):
     """Check if user is authenticated (public endpoint)."""
     if user_session:
@@ -0,0 +1,230 @@
+"""
+Caching utilities.
+
+Provides an in-process TTL cache and a response cache with optional Redis
+backend. The response cache stores already-serialized JSON payloads grouped
+by namespace so read-heavy endpoints can skip the database and Pydantic
+serialization on warm hits. Entries are kept past their TTL for a grace
+period and served stale if rebuilding them fails (stale-while-revalidate).
+
+Without Redis every worker process keeps its own copy, and clear() only
+reaches the worker that handled the mutation. Other workers keep serving
+their old payload until it expires (the entry TTL, or TTL + stale_ttl if
+rebuilds are failing). Set REDIS_URL when running more than one worker.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from .config import get_settings
+
+logger = logging.getLogger("dcp.cache")
+
+KEY_PREFIX = "dcp:cache"
+
+# Global cache instance
+_cache: Optional["ResponseCache"] = None
+
+
+class TTLCache:
+    """
+    Bounded in-process cache whose entries expire after a fixed TTL.
+
+    When full, the oldest inserted entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a value."""
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached payload together with its generation time and TTL."""
+
+    generated_at: float
+    ttl: int
+    payload: bytes
+
+    def is_fresh(self, now: float) -> bool:
+        """Check whether the entry is still within its TTL."""
+        return now - self.generated_at < self.ttl
+
+
+class ResponseCache:
+    """
+    Namespaced payload cache.
+
+    Uses Redis hashes (generated_at, ttl, payload) when a Redis URL is
+    configured, otherwise an in-process dictionary that is not shared
+    between workers (see the module docstring).
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, stale_ttl: int = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_url: Optional Redis connection URL
+            stale_ttl: Seconds an expired entry may still be served if rebuilding fails
+        """
+        self.redis_url = redis_url
+        self.stale_ttl = stale_ttl
+        self._redis = None
+        self._local: dict[str, CacheEntry] = {}
+
+    def _get_redis(self):
+        """Get the Redis client, creating it lazily."""
+        if not self.redis_url:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(self.redis_url)
+            except ImportError:
+                logger.error("redis package not installed. Install with: pip install redis")
+                self.redis_url = None
+                return None
+        return self._redis
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{KEY_PREFIX}:{namespace}:{key}"
+
+    async def get(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry (fresh or stale), or None on miss."""
+        cache_key = self._key(namespace, key)
+        redis = self._get_redis()
+
+        if redis is None:
+            entry = self._local.get(cache_key)
+            if entry and time.time() - entry.generated_at >= entry.ttl + self.stale_ttl:
+                self._local.pop(cache_key, None)
+                return None
+            return entry
+
+        try:
+            data = await redis.hgetall(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {cache_key}: {e}")
+            return None
+        if not data:
+            return None
+        return CacheEntry(
+            generated_at=float(data[b"generated_at"]),
+            ttl=int(data[b"ttl"]),
+            payload=data[b"payload"],
+        )
+
+    async def set(self, namespace: str, key: str, payload: bytes, ttl: int) -> None:
+        """Store a payload under the given namespace and key."""
+        cache_key = self._key(namespace, key)
+        entry = CacheEntry(generated_at=time.time(), ttl=ttl, payload=payload)
+        redis = self._get_redis()
+
+        if redis is None:
+            self._local[cache_key] = entry
+            return
+
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.hset(
+                    cache_key,
+                    mapping={"generated_at": entry.generated_at, "ttl": ttl, "payload": payload},
+                )
+                pipe.expire(cache_key, ttl + self.stale_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache write failed for {cache_key}: {e}")
+
+    async def clear(self, namespace: str) -> None:
+        """Invalidate every entry in a namespace."""
+        prefix = self._key(namespace, "")
+        redis = self._get_redis()
+
+        if redis is None:
+            for cache_key in [k for k in self._local if k.startswith(prefix)]:
+                del self._local[cache_key]
+            return
+
+        try:
+            keys = [k async for k in redis.scan_iter(match=f"{prefix}*")]
+            if keys:
+                await redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache clear failed for namespace {namespace}: {e}")
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        ttl: int,
+        builder: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """
+        Return a cached payload, rebuilding it when missing or expired.
+
+        If the rebuild raises and a stale entry exists, the stale payload is
+        returned instead of propagating the error.
+        """
+        entry = await self.get(namespace, key)
+        if entry is not None and entry.is_fresh(time.time()):
+            return entry.payload
+
+        try:
+            payload = await builder()
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving stale cache entry {namespace}:{key} after rebuild failure: {e}")
+            return entry.payload
+
+        await self.set(namespace, key, payload, ttl)
+        return payload
+
+    async def close(self) -> None:
+        """Close the Redis connection if open."""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the response cache singleton."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(get_settings().redis_url)
+    return _cache
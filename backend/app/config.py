@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +9,13 @@ class Settings(BaseModel):
 
     # Database
     database_url: str = Field(default="postgresql+asyncpg://dcp:dcp@db:5432/dcp")
+    db_pool_size: int = Field(default=20)  # 0 disables pooling (NullPool), e.g. behind PgBouncer
+    db_max_overflow: int = Field(default=40)
+    db_pool_recycle: int = Field(default=1800)  # seconds
+    db_pool_timeout: int = Field(default=30)  # seconds to wait for a free connection
+    db_pre_ping: bool = Field(default=True)
+    db_pool_warmup: int = Field(default=4)  # connections opened on startup, capped at db_pool_size
+    db_create_tables: bool = Field(default=True)  # run create_all on API startup
 
     # Server
     app_port: int = Field(default=8000)
@@ -25,6 +34,7 @@ class Settings(BaseModel):
     session_expire_hours: int = Field(default=24)
     frontend_url: str = Field(default="http://72.61.52.70:8100")
     cookie_domain: str | None = Field(default=None)  # Set to domain for cross-port sharing
+    session_token_hash: str = Field(default="blake2b")  # "blake2b" or "sha256" (FIPS)
 
     # Policy Engine
     policy_path: str | None = None
@@ -42,12 +52,25 @@ class Settings(BaseModel):
     # Security
     environment: str = Field(default="development")
     rate_limit_per_minute: int = Field(default=100)
+    rate_limit_storage_uri: str = Field(default="memory://")  # e.g. "redis://redis:6379" to share limits across workers
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Load settings from environment variables."""
+    """
+    Load settings from environment variables.
+
+    The result is cached; call ``get_settings.cache_clear()`` to re-read the environment.
+    """
     return Settings(
         database_url=os.getenv("DATABASE_URL", Settings.model_fields["database_url"].default),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        db_pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        db_pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        db_pre_ping=os.getenv("DB_PRE_PING", "true").lower() == "true",
+        db_pool_warmup=int(os.getenv("DB_POOL_WARMUP", "4")),
+        db_create_tables=os.getenv("DB_CREATE_TABLES", "true").lower() == "true",
         app_port=int(os.getenv("APP_PORT", Settings.model_fields["app_port"].default)),
         allowed_origins=os.getenv("ALLOWED_ORIGINS", "*").split(","),
         api_prefix=os.getenv("API_PREFIX", Settings.model_fields["api_prefix"].default),
@@ -61,6 +84,7 @@ def get_settings() -> Settings:
         session_expire_hours=int(os.getenv("SESSION_EXPIRE_HOURS", "24")),
         frontend_url=os.getenv("FRONTEND_URL", Settings.model_fields["frontend_url"].default),
         cookie_domain=os.getenv("COOKIE_DOMAIN"),
+        session_token_hash=os.getenv("SESSION_TOKEN_HASH", Settings.model_fields["session_token_hash"].default),
         # Policy Engine
         policy_path=os.getenv("POLICY_PATH"),
         redis_url=os.getenv("REDIS_URL"),
@@ -69,4 +93,5 @@ def get_settings() -> Settings:
         metrics_enabled=os.getenv("METRICS_ENABLED", "true").lower() == "true",
         environment=os.getenv("ENVIRONMENT", "development"),
         rate_limit_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "100")),
+        rate_limit_storage_uri=os.getenv("RATE_LIMIT_STORAGE", Settings.model_fields["rate_limit_storage_uri"].default),
     )
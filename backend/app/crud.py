@@ -1,66 +1,117 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from . import models, schemas
 
 
+class DuplicateDecisionError(Exception):
+    """Raised when a decision's (execution_id, node_id) pair belongs to another org."""
+
+    pass
+
+
+# Children serialized by DecisionOut. The one-to-one children ride along on
+# the main query as outer joins; only the actions collection needs an IN query.
+DECISION_DETAIL_OPTIONS = (
+    joinedload(models.Decision.recommendation),
+    joinedload(models.Decision.policy_snapshot),
+    selectinload(models.Decision.actions),
+)
+
+# Columns serialized by DecisionSummaryOut; the other children are never loaded
+DECISION_SUMMARY_OPTIONS = (
+    load_only(
+        models.Decision.id,
+        models.Decision.flow_id,
+        models.Decision.node_id,
+        models.Decision.status,
+        models.Decision.language,
+        models.Decision.risk_score,
+        models.Decision.confidence_score,
+        models.Decision.estimated_cost,
+        models.Decision.created_at,
+        models.Decision.expires_at,
+    ),
+    joinedload(models.Decision.recommendation).load_only(models.DecisionRecommendation.summary),
+)
+
+
 async def create_decision(
     session: AsyncSession,
     payload: schemas.DecisionCreate,
     org_id: str = "default",
 ) -> models.Decision:
-    # Idempotent on (execution_id, node_id) within the same org
-    existing = await session.execute(
-        select(models.Decision).where(
-            models.Decision.org_id == org_id,
-            models.Decision.execution_id == payload.execution_id,
-            models.Decision.node_id == payload.node_id,
+    # Idempotent on (execution_id, node_id): the insert is skipped on conflict
+    # and the existing decision is returned instead. The id is generated here so
+    # child rows don't need a flush to learn it.
+    decision_id = models.uuid7()
+    result = await session.execute(
+        pg_insert(models.Decision)
+        .values(
+            id=decision_id,
+            org_id=org_id,
+            execution_id=payload.execution_id,
+            flow_id=payload.flow_id,
+            node_id=payload.node_id,
+            status="pending_human_review",
+            language=payload.language,
+            risk_score=payload.risk_score,
+            confidence_score=payload.confidence_score,
+            estimated_cost=payload.estimated_cost,
+            expires_at=payload.expires_at,
         )
+        .on_conflict_do_nothing(index_elements=["execution_id", "node_id"])
+        .returning(models.Decision)
     )
-    decision = existing.scalar_one_or_none()
-    if decision:
+    decision = result.scalar_one_or_none()
+    if decision is None:
+        existing = await session.execute(
+            select(models.Decision).options(*DECISION_DETAIL_OPTIONS).where(
+                models.Decision.org_id == org_id,
+                models.Decision.execution_id == payload.execution_id,
+                models.Decision.node_id == payload.node_id,
+            )
+        )
+        decision = existing.scalar_one_or_none()
+        if decision is None:
+            raise DuplicateDecisionError("A decision for this execution_id and node_id already exists")
         return decision
 
-    decision = models.Decision(
-        org_id=org_id,
-        execution_id=payload.execution_id,
-        flow_id=payload.flow_id,
-        node_id=payload.node_id,
-        status="pending_human_review",
-        language=payload.language,
-        risk_score=payload.risk_score,
-        confidence_score=payload.confidence_score,
-        estimated_cost=payload.estimated_cost,
-        expires_at=payload.expires_at,
-    )
-    session.add(decision)
-    await session.flush()  # to get decision.id
-
-    recommendation = models.DecisionRecommendation(
-        decision_id=decision.id,
-        summary=payload.recommendation.summary,
-        detailed_explanation=payload.recommendation.detailed_explanation,
-        model_used=payload.recommendation.model_used,
-        prompt_version=payload.recommendation.prompt_version,
-    )
-    session.add(recommendation)
-
+    rec = payload.recommendation
+    rec_row = {
+        "decision_id": decision_id,
+        "summary": rec.summary,
+        "detailed_explanation": rec.detailed_explanation,
+        "model_used": rec.model_used,
+        "prompt_version": rec.prompt_version,
+    }
+    await session.execute(insert(models.DecisionRecommendation), [rec_row])
+
+    snapshot = None
     if payload.policy_snapshot:
         snap = payload.policy_snapshot
-        snapshot = models.DecisionPolicySnapshot(
-            decision_id=decision.id,
-            policy_version=snap.policy_version,
-            evaluated_rules=snap.evaluated_rules,
-            result=snap.result,
-        )
-        session.add(snapshot)
+        snap_row = {
+            "decision_id": decision_id,
+            "policy_version": snap.policy_version,
+            "evaluated_rules": snap.evaluated_rules,
+            "result": snap.result,
+        }
+        await session.execute(insert(models.DecisionPolicySnapshot), [snap_row])
+        snapshot = models.DecisionPolicySnapshot(**snap_row)
 
     await session.commit()
-    await session.refresh(decision)
+
+    # Children were written with Core inserts; attach them without a reload
+    set_committed_value(decision, "recommendation", models.DecisionRecommendation(**rec_row))
+    set_committed_value(decision, "policy_snapshot", snapshot)
+    set_committed_value(decision, "actions", [])
     return decision
 
 
@@ -70,78 +121,135 @@ async def list_decisions(
     status: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    summary: bool = False,
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
 ) -> tuple[list[models.Decision], int]:
-    stmt = select(models.Decision).where(models.Decision.org_id == org_id)
+    """
+    Page through an org's decisions, newest first.
+
+    Pass the created_at and id of the last row seen as `before` and
+    `before_id` for keyset paging, which stays fast at any depth; the total
+    then counts the remaining rows. The id breaks ties between decisions
+    created in the same instant. With summary=True only the columns used by
+    DecisionSummaryOut are loaded.
+    """
+    filters = [models.Decision.org_id == org_id]
     if status:
-        stmt = stmt.where(models.Decision.status == status)
-    stmt = stmt.order_by(models.Decision.created_at.desc())
-    total = await session.scalar(select(func.count()).select_from(stmt.subquery()))
-    stmt = stmt.limit(limit).offset(offset)
-    result = await session.execute(stmt)
-    return result.scalars().unique().all(), total or 0
+        filters.append(models.Decision.status == status)
+    if before is not None and before_id is not None:
+        filters.append(tuple_(models.Decision.created_at, models.Decision.id) < (before, before_id))
+    elif before is not None:
+        filters.append(models.Decision.created_at < before)
+
+    # The window count returns the total alongside the page in one round trip
+    stmt = (
+        select(models.Decision, func.count().over().label("total"))
+        .options(*(DECISION_SUMMARY_OPTIONS if summary else DECISION_DETAIL_OPTIONS))
+        .where(*filters)
+        .order_by(models.Decision.created_at.desc(), models.Decision.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    rows = (await session.execute(stmt)).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+
+    if not offset:
+        return [], 0
+
+    # A page past the end carries no window count; count separately
+    total = await session.scalar(select(func.count()).select_from(models.Decision).where(*filters))
+    return [], total or 0
+
 
+# Status a decision moves to for each action type
+ACTION_STATUS = {
+    "approve": "approved",
+    "reject": "rejected",
+    "escalate": "escalated",
+    "modify": "modified",
+}
 
-async def _add_action_and_update_status(
+
+async def apply_action(
     session: AsyncSession,
     decision_id: UUID,
-    org_id: str,
-    status: str,
     action_type: str,
     action: schemas.DecisionActionIn,
-    payload: Optional[dict] = None,
+    org_id: str = "default",
 ) -> models.Decision:
-    result = await session.execute(
-        select(models.Decision).where(
-            models.Decision.id == decision_id,
-            models.Decision.org_id == org_id,
-        )
+    """
+    Record an action on a decision and move it to the matching status.
+
+    Modify actions store their modifications as the action payload.
+    Raises ValueError if the decision does not exist in the org.
+    """
+    status = ACTION_STATUS[action_type]
+    payload = action.modifications if isinstance(action, schemas.DecisionModifyIn) else None
+
+    # populate_existing makes the loader options apply even when the decision
+    # is already in the identity map; otherwise decision.actions would raise
+    decision = await session.get(
+        models.Decision, decision_id, options=DECISION_DETAIL_OPTIONS, populate_existing=True
     )
-    decision = result.scalar_one_or_none()
-    if not decision:
+    if decision is None or decision.org_id != org_id:
         raise ValueError("Decision not found")
 
-    decision.status = status
-    action_row = models.DecisionAction(
-        decision_id=decision.id,
-        action_type=action_type,
-        actor_type=action.actor_type,
-        actor_id=action.actor_id,
-        comment=action.comment,
-        payload=payload,
+    # One round trip for both writes: the status UPDATE rides along as a
+    # data-modifying CTE on the action INSERT. created_at comes from the
+    # column's server default via RETURNING, so the database clock is the
+    # only one; the other values are known, so no refresh is needed.
+    action_row = {
+        "id": models.uuid7(),
+        "decision_id": decision.id,
+        "action_type": action_type,
+        "actor_type": action.actor_type,
+        "actor_id": action.actor_id,
+        "comment": action.comment,
+        "payload": payload,
+    }
+    set_status = (
+        update(models.Decision)
+        .where(models.Decision.id == decision.id)
+        .values(status=status)
+        .returning(models.Decision.id)
+        .cte("set_status")
+    )
+    result = await session.execute(
+        insert(models.DecisionAction)
+        .values(**action_row)
+        .add_cte(set_status)
+        .returning(models.DecisionAction.created_at)
     )
-    session.add(action_row)
+    created_at = result.scalar_one()
     await session.commit()
-    await session.refresh(decision)
+
+    set_committed_value(decision, "status", status)
+    action_model = models.DecisionAction(**action_row, created_at=created_at)
+    set_committed_value(decision, "actions", [*decision.actions, action_model])
     return decision
 
 
 async def approve_decision(
     session: AsyncSession, decision_id: UUID, action: schemas.DecisionActionIn, org_id: str = "default"
 ):
-    return await _add_action_and_update_status(session, decision_id, org_id, "approved", "approve", action)
+    return await apply_action(session, decision_id, "approve", action, org_id)
 
 
 async def reject_decision(
     session: AsyncSession, decision_id: UUID, action: schemas.DecisionActionIn, org_id: str = "default"
 ):
-    return await _add_action_and_update_status(session, decision_id, org_id, "rejected", "reject", action)
+    return await apply_action(session, decision_id, "reject", action, org_id)
 
 
 async def escalate_decision(
     session: AsyncSession, decision_id: UUID, action: schemas.DecisionActionIn, org_id: str = "default"
 ):
-    return await _add_action_and_update_status(session, decision_id, org_id, "escalated", "escalate", action)
+    return await apply_action(session, decision_id, "escalate", action, org_id)
 
 
 async def modify_decision(
     session: AsyncSession, decision_id: UUID, payload: schemas.DecisionModifyIn, org_id: str = "default"
 ):
-    return await _add_action_and_update_status(
-        session,
-        decision_id,
-        org_id,
-        "modified",
-        "modify",
-        payload,
-        payload=payload.modifications,
-    )
+    return await apply_action(session, decision_id, "modify", payload, org_id)
@@ -1,11 +1,38 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from .config import get_settings
 
+logger = logging.getLogger("dcp.database")
+
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=False, future=True)
+if settings.db_pool_size > 0:
+    # LIFO reuse keeps a hot subset of connections and lets idle ones age out
+    pool_args = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_use_lifo": True,
+    }
+else:
+    # An external pooler (e.g. PgBouncer) owns connection reuse
+    pool_args = {"poolclass": NullPool}
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    pool_pre_ping=settings.db_pre_ping,
+    **pool_args,
+)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 Base = declarative_base()
@@ -14,3 +41,24 @@ Base = declarative_base()
 async def get_session() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def warm_up_pool() -> None:
+    """
+    Open a few pool connections up front so the first requests don't pay connect cost.
+
+    Opens db_pool_warmup connections (at most db_pool_size). Failures are
+    logged and never abort startup; the pool connects lazily instead.
+    """
+    size = min(settings.db_pool_warmup, settings.db_pool_size)
+    if size <= 0:
+        return
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(ping() for _ in range(size)), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        logger.warning(f"Pool warm-up opened {size - len(errors)} of {size} connections: {errors[0]}")
@@ -1,17 +0,0 @@
-"""
-Event publishing module.
-
-This is a compatibility layer that re-exports from the events package.
-For new code, import directly from app.events package.
-"""
-from .events.publisher import publish_event, get_publisher, EventPublisher
-from .events.schemas import CloudEvent, create_cloud_event, EventTypes
-
-__all__ = [
-    "publish_event",
-    "get_publisher",
-    "EventPublisher",
-    "CloudEvent",
-    "create_cloud_event",
-    "EventTypes",
-]
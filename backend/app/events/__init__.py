@@ -3,13 +3,16 @@ Events module for DCP.
 
 Provides event publishing with support for multiple backends (logging, Redis, webhooks).
 """
-from .publisher import EventPublisher, get_publisher, publish_event
-from .schemas import CloudEvent, create_cloud_event
+from .publisher import EventPublisher, get_publisher, publish_event, start_event_drain, stop_event_drain
+from .schemas import CloudEvent, EventTypes, create_cloud_event
 
 __all__ = [
     "EventPublisher",
     "get_publisher",
     "publish_event",
+    "start_event_drain",
+    "stop_event_drain",
     "CloudEvent",
     "create_cloud_event",
+    "EventTypes",
 ]
@@ -1,7 +1,7 @@
 """
 Event publisher abstraction with multiple backend support.
 """
-import json
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional
@@ -10,9 +10,31 @@ from .schemas import CloudEvent, create_cloud_event
 
 logger = logging.getLogger("dcp.events")
 
+# Bounds for the in-process event queue drained in the background
+EVENT_QUEUE_SIZE = 10_000
+EVENT_BATCH_SIZE = 100
+EVENT_DRAIN_TIMEOUT_SECONDS = 5.0
+
 # Global publisher instance
 _publisher: Optional["EventPublisher"] = None
 
+# Background drain state; publish_event publishes inline when not running
+_queue: Optional[asyncio.Queue] = None
+_drain_task: Optional[asyncio.Task] = None
+_drain_publisher: Optional["EventPublisher"] = None
+
+
+class _LazyJSON:
+    """Defers event serialization until a log record is actually formatted."""
+
+    __slots__ = ("event",)
+
+    def __init__(self, event: CloudEvent):
+        self.event = event
+
+    def __str__(self) -> str:
+        return self.event.to_json_bytes().decode()
+
 
 class EventPublisher(ABC):
     """Abstract base class for event publishers."""
@@ -27,6 +49,20 @@ class EventPublisher(ABC):
         """
         pass
 
+    async def publish_many(self, events: list[CloudEvent]) -> None:
+        """
+        Publish a batch of CloudEvents.
+
+        Backends that can batch should override this; the default
+        publishes one event at a time.
+        """
+        for event in events:
+            await self.publish(event)
+
+    async def start(self) -> None:
+        """Open backend connections ahead of the first publish (optional)."""
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """Close the publisher and release resources."""
@@ -42,11 +78,16 @@ class LogEventPublisher(EventPublisher):
 
     async def publish(self, event: CloudEvent) -> None:
         """Log the event."""
-        logger.info(
-            "EVENT %s: %s",
-            event.type,
-            json.dumps(event.to_json_dict(), default=str),
-        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("EVENT %s: %s", event.type, _LazyJSON(event))
+
+    async def publish_many(self, events: list[CloudEvent]) -> None:
+        """Log a batch with the same one-record-per-event format as publish."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        for event in events:
+            logger.info("EVENT %s: %s", event.type, _LazyJSON(event))
 
     async def close(self) -> None:
         """No-op for log publisher."""
@@ -79,10 +120,13 @@ class RedisEventPublisher(EventPublisher):
         try:
             import redis.asyncio as redis
 
+            # Payloads are published as bytes; keepalive and periodic health
+            # checks let the one shared client survive idle periods
             self._redis = redis.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
+                socket_keepalive=True,
+                health_check_interval=30,
             )
             # Test connection
             await self._redis.ping()
@@ -96,6 +140,15 @@ class RedisEventPublisher(EventPublisher):
             self._connected = False
             raise
 
+    async def start(self) -> None:
+        """Connect eagerly; failures are retried lazily on the next publish."""
+        from redis.exceptions import RedisError
+
+        try:
+            await self._ensure_connected()
+        except (RedisError, OSError):
+            logger.warning("Redis publisher connect failed; will retry on publish", exc_info=True)
+
     async def publish(self, event: CloudEvent) -> None:
         """
         Publish event to Redis.
@@ -106,7 +159,7 @@ class RedisEventPublisher(EventPublisher):
             await self._ensure_connected()
 
             channel = event.type  # e.g., "dcp.decision.paused"
-            message = json.dumps(event.to_json_dict(), default=str)
+            message = event.to_json_bytes()
 
             await self._redis.publish(channel, message)
             logger.debug(f"Published event {event.id} to channel {channel}")
@@ -114,11 +167,28 @@ class RedisEventPublisher(EventPublisher):
         except Exception as e:
             logger.error(f"Failed to publish event to Redis: {e}")
             # Fall back to logging
-            logger.info(
-                "EVENT (fallback) %s: %s",
-                event.type,
-                json.dumps(event.to_json_dict(), default=str),
-            )
+            logger.info("EVENT (fallback) %s: %s", event.type, _LazyJSON(event))
+
+    async def publish_many(self, events: list[CloudEvent]) -> None:
+        """
+        Publish a batch of events to Redis.
+
+        All PUBLISH commands go out in one non-transactional pipeline.
+        """
+        try:
+            await self._ensure_connected()
+
+            pipe = self._redis.pipeline(transaction=False)
+            for event in events:
+                pipe.publish(event.type, event.to_json_bytes())
+            await pipe.execute()
+            logger.debug(f"Published {len(events)} events to Redis")
+
+        except Exception as e:
+            logger.error(f"Failed to publish {len(events)} events to Redis: {e}")
+            # Fall back to logging
+            for event in events:
+                logger.info("EVENT (fallback) %s: %s", event.type, _LazyJSON(event))
 
     async def close(self) -> None:
         """Close Redis connection."""
@@ -150,6 +220,19 @@ class CompositeEventPublisher(EventPublisher):
             except Exception as e:
                 logger.error(f"Publisher {type(publisher).__name__} failed: {e}")
 
+    async def publish_many(self, events: list[CloudEvent]) -> None:
+        """Hand the whole batch to each configured publisher."""
+        for publisher in self.publishers:
+            try:
+                await publisher.publish_many(events)
+            except Exception as e:
+                logger.error(f"Publisher {type(publisher).__name__} failed: {e}")
+
+    async def start(self) -> None:
+        """Start all configured publishers."""
+        for publisher in self.publishers:
+            await publisher.start()
+
     async def close(self) -> None:
         """Close all publishers."""
         for publisher in self.publishers:
@@ -192,26 +275,97 @@ def get_publisher(redis_url: Optional[str] = None) -> EventPublisher:
     return _publisher
 
 
+async def _drain_events(queue: asyncio.Queue, publisher: EventPublisher) -> None:
+    """Publish queued events in batches until cancelled."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < EVENT_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            await publisher.publish_many(batch)
+        except Exception as e:
+            logger.error(f"Failed to publish {len(batch)} queued events: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def start_event_drain(publisher: Optional[EventPublisher] = None) -> None:
+    """
+    Start publishing events from a background task.
+
+    Once started, publish_event only enqueues and returns.
+
+    Args:
+        publisher: Publisher to drain into (defaults to the singleton)
+    """
+    global _queue, _drain_task, _drain_publisher
+
+    if _drain_task is not None:
+        return
+
+    _drain_publisher = publisher or get_publisher()
+    _queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    _drain_task = asyncio.create_task(_drain_events(_queue, _drain_publisher))
+
+
+async def stop_event_drain() -> None:
+    """Wait for queued events to be published, then stop the background task."""
+    global _queue, _drain_task, _drain_publisher
+
+    if _drain_task is None:
+        return
+
+    # Events published from here on go out inline
+    queue, task = _queue, _drain_task
+    _queue = None
+    _drain_task = None
+    _drain_publisher = None
+
+    try:
+        await asyncio.wait_for(queue.join(), timeout=EVENT_DRAIN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {queue.qsize()} queued events after {EVENT_DRAIN_TIMEOUT_SECONDS}s shutdown wait")
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
 async def publish_event(
     event_type: str,
     payload: dict,
     subject: Optional[str] = None,
     traceparent: Optional[str] = None,
+    publisher: Optional[EventPublisher] = None,
 ) -> None:
     """
     Convenience function to publish an event.
 
+    When the background drain is running the event is only enqueued, so
+    callers never wait on the backend.
+
     Args:
         event_type: Event type (e.g., "dcp.decision.paused")
         payload: Event data payload
         subject: Optional subject identifier
         traceparent: Optional trace context
+        publisher: Publisher for inline publishing (defaults to the singleton)
     """
-    publisher = get_publisher()
     event = create_cloud_event(
         event_type=event_type,
         data=payload,
         subject=subject,
         traceparent=traceparent,
     )
-    await publisher.publish(event)
+
+    if _queue is None:
+        await (publisher or get_publisher()).publish(event)
+        return
+
+    try:
+        _queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning("Event queue full, dropping EVENT %s: %s", event.type, _LazyJSON(event))
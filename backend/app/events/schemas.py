@@ -1,13 +1,18 @@
 """
 Event schemas following CloudEvents 1.0 specification.
 """
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Optional
 from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, Field
 
 
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
 class CloudEvent(BaseModel):
     """
     CloudEvents 1.0 compliant event envelope.
@@ -22,7 +27,7 @@ class CloudEvent(BaseModel):
     specversion: str = "1.0"
 
     # Optional attributes
-    time: datetime = Field(default_factory=datetime.utcnow)
+    time: datetime = Field(default_factory=_utc_now)
     datacontenttype: str = "application/json"
     subject: Optional[str] = None
     traceparent: Optional[str] = None
@@ -30,25 +35,13 @@ class CloudEvent(BaseModel):
     # Event data
     data: dict[str, Any] = Field(default_factory=dict)
 
-    # DCP-specific metadata
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() + "Z",
-        }
-
-    def to_json_dict(self) -> dict:
-        """Convert to JSON-serializable dictionary."""
-        return {
-            "id": self.id,
-            "type": self.type,
-            "source": self.source,
-            "specversion": self.specversion,
-            "time": self.time.isoformat() + "Z",
-            "datacontenttype": self.datacontenttype,
-            "subject": self.subject,
-            "traceparent": self.traceparent,
-            "data": self.data,
-        }
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes, rendering naive times as UTC with a Z suffix."""
+        return orjson.dumps(
+            self.model_dump(),
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        )
 
 
 def create_cloud_event(
@@ -1,31 +1,38 @@
 import asyncio
+import hmac
 import logging
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 from fastapi import Depends, FastAPI, HTTPException, Query, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from . import crud, models, schemas
 from .policy import evaluate_policy
-from .events import publish_event
+from .events import get_publisher, publish_event, start_event_drain, stop_event_drain
 from .config import get_settings
-from .database import Base, engine, get_session
+from .database import AsyncSessionLocal, Base, get_session, warm_up_pool
 from .app_features import router as app_features_router
 from .auth import (
     router as auth_router,
+    ActiveSession,
     get_current_session,
     get_optional_session,
     get_org_id,
     has_permission,
     current_org_id,
 )
-from .models import UserSession
 from .observability.logging import setup_logging
 from .observability.metrics import (
     get_metrics,
     get_metrics_content_type,
     record_decision_created,
     record_decision_action,
+    refresh_pending_decisions,
 )
 from .observability.middleware import RequestTracingMiddleware, MetricsMiddleware
 
@@ -40,34 +47,33 @@ app = FastAPI(
     title="Decision Control Plane API",
     version="2.0.0",
     openapi_url=f"{settings.api_prefix}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Add middlewares (order matters - first added is outermost)
 app.add_middleware(MetricsMiddleware)
 app.add_middleware(RequestTracingMiddleware)
 
-# CORS: When allow_credentials=True, cannot use "*" for origins
-# Build explicit origins list from frontend_url and allowed_origins
-cors_origins = []
-if settings.frontend_url:
-    cors_origins.append(settings.frontend_url)
-for origin in settings.allowed_origins:
-    origin = origin.strip()
-    if origin and origin != "*":
-        cors_origins.append(origin)
-
-# In development without explicit origins, allow the common local URLs
-if not cors_origins or (len(cors_origins) == 0):
-    cors_origins = [
-        "http://localhost:8100",
-        "http://localhost:4173",
-        "http://127.0.0.1:8100",
-        "http://127.0.0.1:4173",
-    ]
+# Local frontend URLs allowed in development when no origins are configured
+DEFAULT_DEV_ORIGINS = frozenset({
+    "http://localhost:8100",
+    "http://localhost:4173",
+    "http://127.0.0.1:8100",
+    "http://127.0.0.1:4173",
+})
+
+# CORS: When allow_credentials=True, cannot use "*" for origins.
+# Built once from frontend_url and allowed_origins; Starlette checks
+# `origin in allow_origins` on every request, so a set makes that O(1).
+CORS_ORIGINS = frozenset(
+    origin
+    for origin in (settings.frontend_url, *(o.strip() for o in settings.allowed_origins))
+    if origin and origin != "*"
+) or DEFAULT_DEV_ORIGINS
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -75,16 +81,37 @@ app.add_middleware(
 
 
 async def init_models():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # DDL runs on a throwaway unpooled engine so it never occupies the request pool
+    ddl_engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        async with ddl_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await ddl_engine.dispose()
 
 
 @app.on_event("startup")
 async def on_startup():
-    await init_models()
+    if settings.db_create_tables:
+        await init_models()
+    await warm_up_pool()
+    app.state.publisher = get_publisher(settings.redis_url)
+    await app.state.publisher.start()
+    start_event_drain(app.state.publisher)
+    if settings.metrics_enabled:
+        app.state.pending_gauge_task = asyncio.create_task(refresh_pending_decisions(AsyncSessionLocal))
     logger.info("DCP API started", extra={"version": "2.0.0", "environment": settings.environment})
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    pending_gauge_task = getattr(app.state, "pending_gauge_task", None)
+    if pending_gauge_task is not None:
+        pending_gauge_task.cancel()
+    await stop_event_drain()
+    await app.state.publisher.close()
+
+
 # Mount TAH routers
 app.include_router(auth_router)  # /auth/tah-callback, /auth/session, etc.
 app.include_router(app_features_router, prefix="/api/v1/app-features")
@@ -96,11 +123,15 @@ async def health():
     return {"status": "ok", "version": "2.0.0"}
 
 
+READINESS_QUERY = text("SELECT 1")
+READINESS_TIMEOUT_SECONDS = 2.0
+
+
 @app.get("/readyz")
 async def readiness(session: AsyncSession = Depends(get_session)):
     """Readiness check - verifies database connectivity."""
     try:
-        await session.execute("SELECT 1")
+        await asyncio.wait_for(session.execute(READINESS_QUERY), timeout=READINESS_TIMEOUT_SECONDS)
         return {"status": "ready", "database": "connected"}
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
@@ -116,16 +147,20 @@ async def metrics():
     )
 
 
+# Full Authorization header expected for legacy bearer auth, compared in constant time
+EXPECTED_AUTHORIZATION = f"Bearer {settings.bearer_token}".encode() if settings.bearer_token else None
+
+
 async def auth_guard(
     authorization: str | None = Header(default=None),
-    user_session: Optional[UserSession] = Depends(get_optional_session),
-) -> Optional[UserSession]:
+    user_session: Optional[ActiveSession] = Depends(get_optional_session),
+) -> Optional[ActiveSession]:
     """
     Auth guard supporting:
     - TAH session authentication (cookie-based)
     - Legacy static bearer token authentication
 
-    Returns UserSession if TAH authenticated, None for bearer token auth.
+    Returns ActiveSession if TAH authenticated, None for bearer token auth.
     """
     # 1. Check TAH session (cookie-based)
     if user_session:
@@ -133,11 +168,10 @@ async def auth_guard(
         return user_session
 
     # 2. Fall back to legacy static bearer token
-    if settings.bearer_token:
+    if EXPECTED_AUTHORIZATION is not None:
         if not authorization or not authorization.startswith("Bearer "):
             raise HTTPException(status_code=401, detail="Unauthorized")
-        token = authorization.split(" ", 1)[1]
-        if token != settings.bearer_token:
+        if not hmac.compare_digest(authorization.encode(), EXPECTED_AUTHORIZATION):
             raise HTTPException(status_code=403, detail="Forbidden")
         # Set default org for bearer token auth
         current_org_id.set("default")
@@ -151,11 +185,17 @@ async def auth_guard(
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+def decision_response(decision: models.Decision, status_code: int = 200) -> Response:
+    """Serialize a decision in one Pydantic pass instead of response_model + jsonable_encoder."""
+    content = schemas.DecisionOut.model_validate(decision).model_dump_json()
+    return Response(content=content, status_code=status_code, media_type=ORJSONResponse.media_type)
+
+
 @app.post(f"{settings.api_prefix}/decision-gates", response_model=schemas.DecisionOut, status_code=201)
 async def create_decision_gate(
     payload: schemas.DecisionCreate,
     session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
+    _: Optional[ActiveSession] = Depends(auth_guard),
 ):
     try:
         # Get org_id from context (set by auth_guard)
@@ -190,99 +230,129 @@ async def create_decision_gate(
                 "org_id": org_id,
             },
         )
-        return decision
+        return decision_response(decision, status_code=201)
+    except crud.DuplicateDecisionError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except Exception as exc:
         logger.error(f"Error creating decision gate: {exc}")
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@app.get(f"{settings.api_prefix}/decisions", response_model=schemas.DecisionListOut)
+BEFORE_DESCRIPTION = "Keyset cursor: only decisions created before this time (use the last item's created_at)"
+BEFORE_ID_DESCRIPTION = "Keyset tie-breaker used with before (use the last item's id)"
+
+
+@app.get(f"{settings.api_prefix}/decisions", response_model=schemas.DecisionListOut, response_class=ORJSONResponse)
 async def list_decisions(
     status: str | None = Query(default=None, description="Filter by status, defaults to pending_human_review"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    before: datetime | None = Query(default=None, description=BEFORE_DESCRIPTION),
+    before_id: UUID | None = Query(default=None, description=BEFORE_ID_DESCRIPTION),
     session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
+    _: Optional[ActiveSession] = Depends(auth_guard),
 ):
     org_id = current_org_id.get() or "default"
     items, total = await crud.list_decisions(
-        session, org_id=org_id, status=status or "pending_human_review", limit=limit, offset=offset
+        session,
+        org_id=org_id,
+        status=status or "pending_human_review",
+        limit=limit,
+        offset=offset,
+        before=before,
+        before_id=before_id,
     )
-    return {"items": items, "total": total}
+    # Serialize in one Pydantic pass instead of response_model + jsonable_encoder
+    page = schemas.DecisionListOut.model_validate({"items": items, "total": total})
+    return Response(content=page.model_dump_json(), media_type=ORJSONResponse.media_type)
 
 
-@app.post(f"{settings.api_prefix}/decisions/{{decision_id}}/approve", response_model=schemas.DecisionOut)
-async def approve_decision(
-    decision_id: str,
-    payload: schemas.DecisionActionIn,
+@app.get(
+    f"{settings.api_prefix}/decisions/summary",
+    response_model=schemas.DecisionSummaryListOut,
+    response_class=ORJSONResponse,
+)
+async def list_decision_summaries(
+    status: str | None = Query(default=None, description="Filter by status, defaults to pending_human_review"),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    before: datetime | None = Query(default=None, description=BEFORE_DESCRIPTION),
+    before_id: UUID | None = Query(default=None, description=BEFORE_ID_DESCRIPTION),
     session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
+    _: Optional[ActiveSession] = Depends(auth_guard),
 ):
-    try:
-        org_id = current_org_id.get() or "default"
-        decision = await crud.approve_decision(session, decision_id, payload, org_id=org_id)
-        record_decision_action(action_type="approve", actor_type=payload.actor_type)
-        await publish_event("dcp.decision.actioned", {"decision_id": str(decision.id), "action": "approve", "org_id": org_id})
-        return decision
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Decision not found")
+    """List decisions without recommendation detail, policy snapshot or actions."""
+    org_id = current_org_id.get() or "default"
+    items, total = await crud.list_decisions(
+        session,
+        org_id=org_id,
+        status=status or "pending_human_review",
+        limit=limit,
+        offset=offset,
+        summary=True,
+        before=before,
+        before_id=before_id,
+    )
+    page = schemas.DecisionSummaryListOut.model_validate({"items": items, "total": total})
+    return Response(content=page.model_dump_json(), media_type=ORJSONResponse.media_type)
 
 
-@app.post(f"{settings.api_prefix}/decisions/{{decision_id}}/reject", response_model=schemas.DecisionOut)
-async def reject_decision(
+async def apply_decision_action(
+    session: AsyncSession,
     decision_id: str,
+    action_type: str,
     payload: schemas.DecisionActionIn,
-    session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
 ):
+    """Shared body of the action endpoints: apply, record metrics, publish."""
+    org_id = current_org_id.get() or "default"
     try:
-        org_id = current_org_id.get() or "default"
-        decision = await crud.reject_decision(session, decision_id, payload, org_id=org_id)
-        record_decision_action(action_type="reject", actor_type=payload.actor_type)
-        await publish_event("dcp.decision.actioned", {"decision_id": str(decision.id), "action": "reject", "org_id": org_id})
-        return decision
+        decision = await crud.apply_action(session, UUID(decision_id), action_type, payload, org_id=org_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Decision not found")
+    record_decision_action(action_type=action_type, actor_type=payload.actor_type)
+    await publish_event(
+        "dcp.decision.actioned", {"decision_id": str(decision.id), "action": action_type, "org_id": org_id}
+    )
+    return decision_response(decision)
 
 
-@app.post(f"{settings.api_prefix}/decisions/{{decision_id}}/escalate", response_model=schemas.DecisionOut)
-async def escalate_decision(
-    decision_id: str,
-    payload: schemas.DecisionActionIn,
-    session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
-):
-    try:
-        org_id = current_org_id.get() or "default"
-        decision = await crud.escalate_decision(session, decision_id, payload, org_id=org_id)
-        record_decision_action(action_type="escalate", actor_type=payload.actor_type)
-        await publish_event("dcp.decision.actioned", {"decision_id": str(decision.id), "action": "escalate", "org_id": org_id})
-        return decision
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Decision not found")
+# Body schema for each action endpoint; the routes are registered in a loop
+ACTION_PAYLOADS = {
+    "approve": schemas.DecisionActionIn,
+    "reject": schemas.DecisionActionIn,
+    "escalate": schemas.DecisionActionIn,
+    "modify": schemas.DecisionModifyIn,
+}
 
 
-@app.post(f"{settings.api_prefix}/decisions/{{decision_id}}/modify", response_model=schemas.DecisionOut)
-async def modify_decision(
-    decision_id: str,
-    payload: schemas.DecisionModifyIn,
-    session: AsyncSession = Depends(get_session),
-    _: Optional[UserSession] = Depends(auth_guard),
-):
-    try:
-        org_id = current_org_id.get() or "default"
-        decision = await crud.modify_decision(session, decision_id, payload, org_id=org_id)
-        record_decision_action(action_type="modify", actor_type=payload.actor_type)
-        await publish_event("dcp.decision.actioned", {"decision_id": str(decision.id), "action": "modify", "org_id": org_id})
-        return decision
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Decision not found")
+def make_action_endpoint(action_type: str, payload_model: type[schemas.DecisionActionIn]):
+    """Build the POST /decisions/{decision_id}/<action> handler for one action type."""
+
+    async def endpoint(
+        decision_id: str,
+        payload: payload_model,
+        session: AsyncSession = Depends(get_session),
+        _: Optional[ActiveSession] = Depends(auth_guard),
+    ):
+        return await apply_decision_action(session, decision_id, action_type, payload)
+
+    endpoint.__name__ = f"{action_type}_decision"
+    return endpoint
+
+
+for _action_type, _payload_model in ACTION_PAYLOADS.items():
+    app.add_api_route(
+        f"{settings.api_prefix}/decisions/{{decision_id}}/{_action_type}",
+        make_action_endpoint(_action_type, _payload_model),
+        methods=["POST"],
+        response_model=schemas.DecisionOut,
+    )
 
 
 @app.post(f"{settings.api_prefix}/policy/evaluate")
 async def policy_evaluate(
     payload: schemas.DecisionCreate,
-    _: Optional[UserSession] = Depends(auth_guard),
+    _: Optional[ActiveSession] = Depends(auth_guard),
 ):
     result = evaluate_policy(
         payload.risk_score, payload.confidence_score, payload.estimated_cost, payload.compliance_flags
@@ -1,5 +1,6 @@
+import os
+import time
 import uuid
-from datetime import datetime
 
 from sqlalchemy import (
     JSON,
@@ -9,11 +10,14 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    LargeBinary,
     Numeric,
     String,
     Text,
     UniqueConstraint,
     Float,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, INET
 from sqlalchemy.orm import relationship
@@ -21,6 +25,20 @@ from sqlalchemy.orm import relationship
 from .database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new decision and
+    action keys land on the right edge of the primary key b-tree instead of
+    on a random leaf page.
+    """
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 DecisionStatusEnum = Enum(
     "created",
     "pending_human_review",
@@ -42,10 +60,25 @@ class Decision(Base):
     __tablename__ = "decision"
     __table_args__ = (
         UniqueConstraint("execution_id", "node_id", name="uq_decision_execution_node"),
-        Index("idx_decision_org", "org_id"),
+        # Serves list_decisions (org + status filter, newest first) without a sort;
+        # its org_id prefix also covers plain org lookups
+        Index("idx_decision_org_status_created", "org_id", "status", text("created_at DESC")),
+        # Much smaller b-tree for the default inbox listing (pending decisions only)
+        Index(
+            "idx_decision_pending",
+            "org_id",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'pending_human_review'"),
+        ),
+        # Lets the expiration worker find overdue pending decisions without a scan
+        Index(
+            "idx_decision_pending_expiry",
+            "expires_at",
+            postgresql_where=text("status = 'pending_human_review' AND expires_at IS NOT NULL"),
+        ),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     org_id = Column(String(100), nullable=False, default="default")  # TAH org_id - NO FK
     execution_id = Column(UUID(as_uuid=True), nullable=False)
     flow_id = Column(String, nullable=False)
@@ -54,30 +87,32 @@ class Decision(Base):
     language = Column(String, nullable=False, default="en")
     risk_score = Column(Float, nullable=True)
     confidence_score = Column(Float, nullable=True)
-    estimated_cost = Column(Numeric(12, 2), nullable=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    estimated_cost = Column(Numeric(12, 2, asdecimal=False), nullable=True)  # read back as float
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Children are never loaded implicitly: queries opt in with loader options
+    # (see crud.DECISION_DETAIL_OPTIONS) and any other access raises
     recommendation = relationship(
         "DecisionRecommendation",
         back_populates="decision",
         uselist=False,
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
     actions = relationship(
         "DecisionAction",
         back_populates="decision",
         cascade="all, delete-orphan",
         order_by="DecisionAction.created_at",
-        lazy="selectin",
+        lazy="raise",
     )
     policy_snapshot = relationship(
         "DecisionPolicySnapshot",
         back_populates="decision",
         uselist=False,
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -95,15 +130,19 @@ class DecisionRecommendation(Base):
 
 class DecisionAction(Base):
     __tablename__ = "decision_action"
+    __table_args__ = (
+        # Serves the actions loader (decision_id IN (...) ORDER BY created_at)
+        Index("idx_decision_action_decision_created", "decision_id", "created_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    decision_id = Column(UUID(as_uuid=True), ForeignKey("decision.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    decision_id = Column(UUID(as_uuid=True), ForeignKey("decision.id", ondelete="CASCADE"), nullable=False)
     action_type = Column(ActionTypeEnum, nullable=False)
     actor_type = Column(ActorTypeEnum, nullable=False, default="human")
     actor_id = Column(String, nullable=True)
     comment = Column(String, nullable=True)
     payload = Column(JSON, nullable=True)  # optional structured modifications/override context
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     decision = relationship("Decision", back_populates="actions")
 
@@ -130,11 +169,11 @@ class AppFeature(Base):
     path = Column(String(255), nullable=True)
     icon = Column(String(100), nullable=True)
     actions = Column(JSON, default=list)  # ["read", "create", "update", "delete", "execute"]
-    is_public = Column(String(10), default="false")  # stored as string for compatibility
-    requires_org = Column(String(10), default="true")
+    is_public = Column(Boolean, nullable=False, default=False)
+    requires_org = Column(Boolean, nullable=False, default=True)
     extra_data = Column(JSON, nullable=True)  # renamed from metadata (reserved by SQLAlchemy)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
 
 class User(Base):
@@ -155,8 +194,8 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)
     is_active = Column(Boolean, default=True)
     last_login_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
 
@@ -166,7 +205,13 @@ class UserSession(Base):
     __tablename__ = "user_sessions"
     __table_args__ = (
         Index("idx_sessions_user", "user_id"),
-        Index("idx_sessions_token", "token_hash"),
+        # Partial index covering only live (unrevoked) sessions for cookie lookups
+        Index(
+            "idx_sessions_token_live",
+            "token_hash",
+            "expires_at",
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
         Index("idx_sessions_org", "org_id"),
         Index("idx_sessions_expires", "expires_at"),
     )
@@ -174,14 +219,14 @@ class UserSession(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     org_id = Column(String(100), nullable=False)  # From JWT - NO FK
-    token_hash = Column(String(255), nullable=False)
+    token_hash = Column(LargeBinary(32), nullable=False)  # raw 32-byte digest
     tah_token_exp = Column(DateTime(timezone=True), nullable=True)
     tah_permissions = Column(JSON, default=list)
     tah_roles = Column(JSON, default=list)
     tenant_id = Column(String(100), nullable=True)  # TAH tenant_id for API calls
     ip_address = Column(INET, nullable=True)
     user_agent = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     revoked_at = Column(DateTime(timezone=True), nullable=True)
 
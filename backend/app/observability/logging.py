@@ -3,42 +3,61 @@ Structured logging configuration for DCP.
 
 Provides JSON-formatted logs for better observability and log aggregation.
 """
+import atexit
 import logging
+import queue
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
+# Attributes every LogRecord carries; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
 
-class DCPJsonFormatter(jsonlogger.JsonFormatter):
-    """
-    Custom JSON formatter for DCP logs.
+# Fields added by the innermost active LogContext in the current task
+_log_context: ContextVar[dict] = ContextVar("dcp_log_context", default={})
 
-    Adds standard fields and renames some for consistency.
-    """
+# Background thread writing queued records; replaced on each setup_logging call
+_listener: Optional[QueueListener] = None
 
-    def add_fields(self, log_record, record, message_dict):
-        super().add_fields(log_record, record, message_dict)
 
-        # Add standard fields
-        log_record["timestamp"] = log_record.pop("asctime", None)
-        log_record["level"] = log_record.pop("levelname", record.levelname)
-        log_record["logger"] = record.name
-        log_record["service"] = "dcp"
+class DCPJsonFormatter(logging.Formatter):
+    """
+    Custom JSON formatter for DCP logs.
 
-        # Add trace context if available
-        if hasattr(record, "trace_id"):
-            log_record["trace_id"] = record.trace_id
-        if hasattr(record, "request_id"):
-            log_record["request_id"] = record.request_id
+    Emits one orjson-encoded object per record with the standard fields
+    (timestamp, level, logger, service) followed by any `extra` fields,
+    such as trace_id, request_id, decision_id, flow_id and user_id.
+    """
 
-        # Add extra fields
-        if hasattr(record, "decision_id"):
-            log_record["decision_id"] = record.decision_id
-        if hasattr(record, "flow_id"):
-            log_record["flow_id"] = record.flow_id
-        if hasattr(record, "user_id"):
-            log_record["user_id"] = record.user_id
+    def format(self, record: logging.LogRecord) -> str:
+        log_record = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "name": record.name,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "service": "dcp",
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_record[key] = value
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(log_record, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z).decode()
+
+
+class LogContextFilter(logging.Filter):
+    """Copies the current LogContext fields onto each record; explicit `extra` wins."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            record.__dict__.setdefault(key, value)
+        return True
 
 
 def setup_logging(
@@ -54,41 +73,64 @@ def setup_logging(
         json_format: Use JSON format (True) or plain text (False)
         log_file: Optional log file path
     """
+    global _listener
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
     # Clear existing handlers
     root_logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
 
     # Create formatter
     if json_format:
-        formatter = DCPJsonFormatter(
-            "%(asctime)s %(levelname)s %(name)s %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S%z",
-        )
+        formatter = DCPJsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z")
     else:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
+    # Records are formatted on the logging thread (so LogContext fields are
+    # still in scope) and only queued; a listener thread does the blocking
+    # writes, keeping stdout/file I/O off the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(formatter)
+    queue_handler.addFilter(LogContextFilter())
+    root_logger.addHandler(queue_handler)
+
+    # Output handlers receive the already formatted line
+    preformatted = logging.Formatter("%(message)s")
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(preformatted)
+    handlers = [console_handler]
 
     # File handler (if specified)
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(preformatted)
+        handlers.append(file_handler)
+
+    _listener = QueueListener(log_queue, *handlers)
+    _listener.start()
 
     # Suppress noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the given name.
@@ -106,6 +148,10 @@ class LogContext:
     """
     Context manager for adding extra fields to log records.
 
+    The fields live in a ContextVar, so concurrent tasks never see each
+    other's context. They are applied by the LogContextFilter installed by
+    setup_logging.
+
     Usage:
         with LogContext(decision_id="123", flow_id="flow-1"):
             logger.info("Processing decision")
@@ -113,22 +159,12 @@ class LogContext:
 
     def __init__(self, **kwargs):
         self.extra = kwargs
-        self.old_factory = None
+        self._token = None
 
     def __enter__(self):
-        self.old_factory = logging.getLogRecordFactory()
-
-        extra = self.extra
-
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in extra.items():
-                setattr(record, key, value)
-            return record
-
-        logging.setLogRecordFactory(record_factory)
+        self._token = _log_context.set({**_log_context.get(), **self.extra})
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        logging.setLogRecordFactory(self.old_factory)
+        _log_context.reset(self._token)
         return False
@@ -3,7 +3,17 @@ Prometheus metrics for DCP.
 
 Provides counters, histograms, and gauges for monitoring application behavior.
 """
+import asyncio
+import logging
+
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger("dcp.metrics")
+
+# How often pending_decisions_gauge is re-read from the database
+PENDING_GAUGE_INTERVAL_SECONDS = 15.0
 
 
 # Decision metrics
@@ -120,3 +130,24 @@ def record_event_published(event_type: str, success: bool) -> None:
     """Record an event publication."""
     status = "success" if success else "failure"
     event_published_total.labels(event_type=event_type, status=status).inc()
+
+
+async def refresh_pending_decisions(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float = PENDING_GAUGE_INTERVAL_SECONDS,
+) -> None:
+    """
+    Keep pending_decisions_gauge in sync with the database until cancelled.
+
+    The count is served by the partial idx_decision_pending index.
+    """
+    from ..models import Decision
+
+    stmt = select(func.count()).select_from(Decision).where(Decision.status == "pending_human_review")
+    while True:
+        try:
+            async with session_factory() as session:
+                pending_decisions_gauge.set(await session.scalar(stmt) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to refresh pending decisions gauge: {e}")
+        await asyncio.sleep(interval)
@@ -1,15 +1,19 @@
 """
 Middleware for request tracing and metrics collection.
 """
+import itertools
+import os
+import re
 import time
 import logging
-from uuid import uuid4
 from typing import Callable
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from ..config import get_settings
+from .logging import LogContext
 from .metrics import (
     request_duration_seconds,
     request_total,
@@ -18,13 +22,78 @@ from .metrics import (
 
 logger = logging.getLogger("dcp.middleware")
 
+# Probe, scrape and docs paths that are not worth request metrics
+# (/metrics is also skipped to avoid recursion)
+METRICS_SKIP_PATHS = frozenset({
+    "/metrics",
+    "/healthz",
+    "/readyz",
+    "/favicon.ico",
+    "/docs",
+    "/redoc",
+    f"{get_settings().api_prefix}/openapi.json",
+})
+
+# UUIDs anywhere in the path, or whole numeric path segments
+_UUID_OR_ID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|(/)\d+(?=/|$)",
+    re.IGNORECASE,
+)
+
+
+# A path can only hold an id if it has a digit (numeric id) or a dash (UUID)
+_ID_HINT_CHARS = frozenset("0123456789-")
+
+
+def _id_placeholder(match: re.Match) -> str:
+    return "/{id}" if match.group(1) else "{id}"
+
+
+# Bound (histogram, counter) children per (method, endpoint, status)
+METRIC_CHILD_CACHE_SIZE = 4096
+_metric_children: dict[tuple[str, str, str], tuple] = {}
+
+
+def _request_metrics(method: str, endpoint: str, status: str) -> tuple:
+    """Return the labelled duration and count children, binding them once."""
+    key = (method, endpoint, status)
+    children = _metric_children.get(key)
+    if children is None:
+        if len(_metric_children) >= METRIC_CHILD_CACHE_SIZE:
+            _metric_children.pop(next(iter(_metric_children)))
+        children = (request_duration_seconds.labels(*key), request_total.labels(*key))
+        _metric_children[key] = children
+    return children
+
+
+# Generated trace ids are a random per-process prefix plus a counter: unique
+# across workers and replicas without an os.urandom call per request
+_trace_prefix = os.urandom(8).hex()
+_trace_counter = itertools.count()
+
+
+def _reseed_trace_ids() -> None:
+    global _trace_prefix, _trace_counter
+    _trace_prefix = os.urandom(8).hex()
+    _trace_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reseed_trace_ids)
+
+
+def new_trace_id() -> str:
+    """Return a fresh 32 hex character trace id."""
+    return f"{_trace_prefix}{next(_trace_counter):016x}"
+
 
 class RequestTracingMiddleware(BaseHTTPMiddleware):
     """
     Middleware that adds trace IDs to requests.
 
     Extracts trace ID from X-Trace-ID or X-Request-ID headers,
-    or generates a new one if not present.
+    or generates a new one if not present. The trace ID is bound to the
+    log context, so every record logged while handling the request
+    carries it.
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -32,14 +101,15 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
         trace_id = (
             request.headers.get("X-Trace-ID")
             or request.headers.get("X-Request-ID")
-            or str(uuid4())
+            or new_trace_id()
         )
 
         # Store in request state
         request.state.trace_id = trace_id
 
         # Process request
-        response = await call_next(request)
+        with LogContext(trace_id=trace_id):
+            response = await call_next(request)
 
         # Add trace ID to response headers
         response.headers["X-Trace-ID"] = trace_id
@@ -57,16 +127,26 @@ class MetricsMiddleware(BaseHTTPMiddleware):
     - Active connections gauge
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics":
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable,
+        # Bound once at definition so the per-request calls are local lookups
+        _perf_counter: Callable[[], float] = time.perf_counter,
+        _inc_active: Callable[[], None] = active_connections_gauge.inc,
+        _dec_active: Callable[[], None] = active_connections_gauge.dec,
+    ) -> Response:
+        # Read the raw path from the scope rather than building request.url
+        path = request.scope["path"]
+
+        if path in METRICS_SKIP_PATHS:
             return await call_next(request)
 
         # Track active connections
-        active_connections_gauge.inc()
+        _inc_active()
 
         # Record start time
-        start_time = time.perf_counter()
+        start_time = _perf_counter()
 
         try:
             # Process request
@@ -77,27 +157,21 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             raise
         finally:
             # Calculate duration
-            duration = time.perf_counter() - start_time
+            duration = _perf_counter() - start_time
 
-            # Get endpoint path (normalize path parameters)
-            endpoint = self._normalize_path(request.url.path)
+            # Label with the matched route template; only unmatched paths
+            # (404s) need their ids normalized away
+            route = request.scope.get("route")
+            endpoint = getattr(route, "path", None) or self._normalize_path(path)
             method = request.method
 
             # Record metrics
-            request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint,
-                status=str(status_code),
-            ).observe(duration)
-
-            request_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status=str(status_code),
-            ).inc()
+            duration_child, total_child = _request_metrics(method, endpoint, str(status_code))
+            duration_child.observe(duration)
+            total_child.inc()
 
             # Update active connections
-            active_connections_gauge.dec()
+            _dec_active()
 
         return response
 
@@ -107,20 +181,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
 
         This prevents high cardinality in metrics labels.
         """
-        import re
-
-        # Replace UUIDs with placeholder
-        path = re.sub(
-            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "{id}",
-            path,
-            flags=re.IGNORECASE,
-        )
-
-        # Replace numeric IDs with placeholder
-        path = re.sub(r"/\d+(?=/|$)", "/{id}", path)
-
-        return path
+        if _ID_HINT_CHARS.isdisjoint(path):
+            return path
+        return _UUID_OR_ID_RE.sub(_id_placeholder, path)
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -132,35 +195,41 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # Get trace ID
         trace_id = getattr(request.state, "trace_id", "unknown")
 
-        # Log request
-        logger.info(
-            "Request started",
-            extra={
-                "trace_id": trace_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else "unknown",
-            },
-        )
-
-        start_time = time.perf_counter()
-
-        try:
-            response = await call_next(request)
-            duration = time.perf_counter() - start_time
+        # Checked once per request; at WARNING and above the request/response
+        # logs (and their extra dicts) are skipped entirely
+        info_enabled = logger.isEnabledFor(logging.INFO)
 
-            # Log response
+        # Log request
+        if info_enabled:
             logger.info(
-                "Request completed",
+                "Request started",
                 extra={
                     "trace_id": trace_id,
                     "method": request.method,
                     "path": request.url.path,
-                    "status": response.status_code,
-                    "duration_ms": round(duration * 1000, 2),
+                    "client": request.client.host if request.client else "unknown",
                 },
             )
 
+        start_time = time.perf_counter()
+
+        try:
+            response = await call_next(request)
+
+            # Log response
+            if info_enabled:
+                duration = time.perf_counter() - start_time
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "trace_id": trace_id,
+                        "method": request.method,
+                        "path": request.url.path,
+                        "status": response.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                    },
+                )
+
             return response
 
         except Exception as e:
@@ -4,24 +4,35 @@ Policy Engine module for DCP.
 Provides JSON-based DSL evaluation for decision policies.
 """
 import logging
+from functools import lru_cache
 from typing import Optional
 
+from ..config import get_settings
+
 from .engine import PolicyEngine, PolicyResult
-from .loader import load_policy_from_file, load_policy_from_dict, get_policy_engine
+from .loader import load_policy_from_file, load_policy_from_dict, get_policy_engine, reset_policy_engine
 from .exceptions import PolicyEvaluationError, PolicyLoadError
 
 logger = logging.getLogger("dcp.policy")
 
-# Global policy engine instance
-_engine: Optional[PolicyEngine] = None
+# Distinct input combinations remembered by evaluate_policy
+POLICY_CACHE_SIZE = 4096
 
 
 def get_engine() -> PolicyEngine:
-    """Get or create the policy engine singleton."""
-    global _engine
-    if _engine is None:
-        _engine = get_policy_engine()
-    return _engine
+    """
+    Get the policy engine for the configured POLICY_PATH.
+
+    The loader caches compiled policies by file modification time, so an
+    edited policy file is picked up on the next call.
+    """
+    return get_policy_engine(get_settings().policy_path)
+
+
+def clear_policy_cache() -> None:
+    """Forget the loaded policy engines and every memoized evaluation result."""
+    _evaluate_cached.cache_clear()
+    reset_policy_engine()
 
 
 def evaluate_policy(
@@ -51,24 +62,58 @@ def evaluate_policy(
     if use_engine:
         try:
             engine = get_engine()
-            context = {
-                "risk_score": risk_score,
-                "confidence_score": confidence_score,
-                "estimated_cost": estimated_cost,
-                "compliance_flags": compliance_flags if compliance_flags else None,
-                "impact_level": impact_level,
-                **extra_context,
-            }
-            result = engine.evaluate(context)
-            return {"result": result.result, "reason": result.reason}
+            # Engine evaluation is pure, so plain inputs are answered from a
+            # cache keyed on the engine too; a reloaded policy misses it.
+            # Failures raise out of the cached call and are never stored.
+            if not extra_context:
+                flags = tuple(compliance_flags) if compliance_flags else None
+                return dict(_evaluate_cached(engine, risk_score, confidence_score, estimated_cost, flags, impact_level))
+            return _evaluate_engine(
+                engine, risk_score, confidence_score, estimated_cost, compliance_flags, impact_level, **extra_context
+            )
         except Exception as e:
             logger.warning(f"Engine evaluation failed, falling back to heuristic: {e}")
-            # Fall back to heuristic
 
     # Legacy heuristic policy
     return _evaluate_heuristic(risk_score, confidence_score, estimated_cost, compliance_flags)
 
 
+@lru_cache(maxsize=POLICY_CACHE_SIZE)
+def _evaluate_cached(
+    engine: PolicyEngine,
+    risk_score: Optional[float],
+    confidence_score: Optional[float],
+    estimated_cost: Optional[float],
+    compliance_flags: Optional[tuple[str, ...]],
+    impact_level: Optional[str],
+) -> dict:
+    """Memoized engine evaluation; callers get a copy of the cached dict."""
+    flags = list(compliance_flags) if compliance_flags else None
+    return _evaluate_engine(engine, risk_score, confidence_score, estimated_cost, flags, impact_level)
+
+
+def _evaluate_engine(
+    engine: PolicyEngine,
+    risk_score: Optional[float],
+    confidence_score: Optional[float],
+    estimated_cost: Optional[float],
+    compliance_flags: Optional[list[str]],
+    impact_level: Optional[str],
+    **extra_context,
+) -> dict:
+    """Evaluate with the DSL engine; errors propagate to evaluate_policy."""
+    context = {
+        "risk_score": risk_score,
+        "confidence_score": confidence_score,
+        "estimated_cost": estimated_cost,
+        "compliance_flags": compliance_flags if compliance_flags else None,
+        "impact_level": impact_level,
+        **extra_context,
+    }
+    result = engine.evaluate(context)
+    return {"result": result.result, "reason": result.reason}
+
+
 def _evaluate_heuristic(
     risk_score: Optional[float],
     confidence_score: Optional[float],
@@ -83,7 +128,7 @@ def _evaluate_heuristic(
     - auto_approve if risk <= 0.2 and confidence >= 0.8 and cost <= 500
     - require_human otherwise
     """
-    if compliance_flags and len(compliance_flags) > 0:
+    if compliance_flags:
         return {"result": "force_escalation", "reason": "Compliance flag"}
     if risk_score is not None and risk_score >= 0.8:
         return {"result": "force_escalation", "reason": "High risk"}
@@ -108,4 +153,5 @@ __all__ = [
     "PolicyLoadError",
     "evaluate_policy",
     "get_engine",
+    "clear_policy_cache",
 ]
@@ -10,9 +10,9 @@ Supports:
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from .operators import get_operator, is_operator
+from .operators import NUMERIC_COMPARISONS, get_operator, is_operator
 from .exceptions import PolicyEvaluationError, InvalidConditionError
 
 logger = logging.getLogger("dcp.policy")
@@ -20,6 +20,155 @@ logger = logging.getLogger("dcp.policy")
 # Pattern to match template variables like {{risk_score}}
 TEMPLATE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
 
+# A condition compiled into a predicate over the evaluation context
+Predicate = Callable[[dict], bool]
+
+
+def _always_true(context: dict) -> bool:
+    return True
+
+
+def _compile_value(value: Any) -> Callable[[dict], Any]:
+    """
+    Compile an operand into a resolver over the context.
+
+    "{{var}}" becomes a context lookup and strings embedding templates
+    become a precomputed substitution; anything else is a constant. The
+    template regex therefore only runs here, never per evaluation.
+    """
+    if not isinstance(value, str):
+        return lambda context: value
+
+    match = TEMPLATE_PATTERN.match(value)
+    if match:
+        var_name = match.group(1)
+        return lambda context: context.get(var_name)
+
+    parts = TEMPLATE_PATTERN.split(value)
+    if len(parts) == 1:
+        return lambda context: value
+
+    # split() alternates literal text and variable names: lit, var, lit, ..., lit
+    head, var_names, literals = parts[0], parts[1::2], parts[2::2]
+
+    def substitute(context: dict) -> str:
+        pieces = [head]
+        for var_name, literal in zip(var_names, literals):
+            val = context.get(var_name)
+            pieces.append(str(val) if val is not None else "")
+            pieces.append(literal)
+        return "".join(pieces)
+
+    return substitute
+
+
+def _numeric_constant(value: Any) -> Optional[float]:
+    """Float value of a constant numeric operand, or None if it has to be resolved per call."""
+    if isinstance(value, (int, float)):
+        try:
+            return float(value)
+        except OverflowError:
+            return None
+    return None
+
+
+def _bound_comparison(compare: Callable[[float, float], bool], left: Callable[[dict], Any], bound: float) -> Predicate:
+    """Numeric comparison against a constant that was coerced to float at load time."""
+
+    def predicate(context: dict) -> bool:
+        value = left(context)
+        if value is None:
+            return False
+        try:
+            return compare(float(value), bound)
+        except (ValueError, TypeError):
+            return False
+
+    return predicate
+
+
+def _template_var(value: Any) -> Optional[str]:
+    """Name of the variable an operand resolves to directly, if any."""
+    if isinstance(value, str):
+        match = TEMPLATE_PATTERN.match(value)
+        if match:
+            return match.group(1)
+    return None
+
+
+# Operators that are always False when the given operand (0 = left, 1 = right) is None
+_NONE_IS_FALSE = {
+    "gt": (0, 1),
+    "gte": (0, 1),
+    "lt": (0, 1),
+    "lte": (0, 1),
+    "matches": (0, 1),
+    "includes": (0,),
+    "in": (1,),
+}
+
+
+def _required_vars(condition: Any) -> Optional[frozenset[str]]:
+    """
+    Variables that must be set (not None) for the condition to match.
+
+    Returns None for conditions containing a malformed part: those must
+    always be evaluated so their error is reported exactly as before.
+    """
+    if not condition:
+        return frozenset()
+    if not isinstance(condition, dict):
+        return None
+
+    for key in ("all", "any"):
+        if key in condition:
+            subconditions = condition[key]
+            if not isinstance(subconditions, list):
+                return None
+            required = [_required_vars(c) for c in subconditions]
+            if None in required:
+                return None
+            if not required:
+                return frozenset()
+            # all() needs every child's variables, any() only those shared by all children
+            return frozenset().union(*required) if key == "all" else frozenset.intersection(*required)
+
+    op_name, args = next(iter(condition.items()))
+    if not is_operator(op_name):
+        return None
+    if op_name in ("missing", "exists"):
+        var_name = _template_var(args[0] if isinstance(args, list) and len(args) >= 1 else args)
+        return frozenset({var_name}) if op_name == "exists" and var_name else frozenset()
+    if not isinstance(args, list) or len(args) < 2:
+        return None
+    var_names = (_template_var(args[i]) for i in _NONE_IS_FALSE.get(op_name, ()))
+    return frozenset(name for name in var_names if name)
+
+
+def _flatten_logical(key: str, subconditions: list) -> list:
+    """Inline nested conditions of the same kind: all(a, all(b, c)) is all(a, b, c)."""
+    flat = []
+    for condition in subconditions:
+        # "all" takes precedence when a condition has both keys
+        if (
+            isinstance(condition, dict)
+            and isinstance(condition.get(key), list)
+            and (key == "all" or "all" not in condition)
+        ):
+            flat.extend(_flatten_logical(key, condition[key]))
+        else:
+            flat.append(condition)
+    return flat
+
+
+def _invalid(condition: Any, reason: str) -> Predicate:
+    """Predicate for a malformed condition: raises when (and only if) it is reached."""
+
+    def fail(context: dict) -> bool:
+        raise InvalidConditionError(condition, reason)
+
+    return fail
+
 
 @dataclass
 class PolicyResult:
@@ -44,7 +193,11 @@ class PolicyEngine:
     """
     Engine for evaluating JSON-based policy rules.
 
-    Rules are evaluated top-down, first match wins.
+    Rules are evaluated top-down, first match wins. Each rule's condition
+    is compiled once, at construction, into a predicate closure, so
+    evaluate() does no per-call operator dispatch. Compound rules whose
+    required variables are unset in the context are recorded as not
+    matched without calling their predicate.
 
     Example policy:
     {
@@ -73,6 +226,15 @@ class PolicyEngine:
             "result": "require_human",
             "reason": "No rule matched",
         })
+        self._compiled_rules: list[tuple[str, tuple[str, ...], Predicate, dict]] = [
+            (
+                rule.get("id", "unknown"),
+                self._prefilter_vars(rule.get("when", {})),
+                self._compile_condition(rule.get("when", {})),
+                rule.get("then", {}),
+            )
+            for rule in self.rules
+        ]
 
     def evaluate(self, context: dict) -> PolicyResult:
         """
@@ -86,13 +248,10 @@ class PolicyEngine:
         """
         evaluated_rules = []
 
-        for rule in self.rules:
-            rule_id = rule.get("id", "unknown")
-            condition = rule.get("when", {})
-            then = rule.get("then", {})
-
+        for rule_id, required, predicate, then in self._compiled_rules:
             try:
-                matched = self._evaluate_condition(condition, context)
+                # A rule cannot match while one of its required variables is unset
+                matched = not (required and None in map(context.get, required)) and predicate(context)
                 evaluated_rules.append({
                     "id": rule_id,
                     "matched": matched,
@@ -126,97 +285,101 @@ class PolicyEngine:
             evaluated_rules=evaluated_rules,
         )
 
-    def _evaluate_condition(self, condition: dict, context: dict) -> bool:
+    def _prefilter_vars(self, condition: Any) -> tuple[str, ...]:
+        """
+        Variables checked before a rule's predicate is called.
+
+        Only all/any conditions are pre-filtered: for a single comparison the
+        check would cost as much as the predicate itself.
         """
-        Recursively evaluate a condition against the context.
+        if not isinstance(condition, dict) or not ("all" in condition or "any" in condition):
+            return ()
+        return tuple(_required_vars(condition) or ())
+
+    def _compile_condition(self, condition: Any) -> Predicate:
+        """
+        Recursively compile a condition into a predicate over the context.
+
+        Malformed conditions compile into a predicate that raises
+        InvalidConditionError when reached, matching evaluation-time errors.
 
         Args:
             condition: Condition dictionary (e.g., {"gte": ["{{risk_score}}", 0.8]})
-            context: Context dictionary with values
 
         Returns:
-            True if condition is satisfied, False otherwise
+            Callable taking the context and returning True if the condition is satisfied
         """
         if not condition:
-            return True
+            return _always_true
 
         if not isinstance(condition, dict):
-            raise InvalidConditionError(condition, "Condition must be a dictionary")
+            return _invalid(condition, "Condition must be a dictionary")
 
-        # Handle logical operators
+        # Handle logical operators (short-circuiting, like all()/any()). Nested
+        # nodes of the same kind are inlined and single children returned as
+        # is, so a predicate call is one frame per alternation of all/any
+        # rather than per nesting level
         if "all" in condition:
             subconditions = condition["all"]
             if not isinstance(subconditions, list):
-                raise InvalidConditionError(condition, "'all' requires a list of conditions")
-            return all(self._evaluate_condition(c, context) for c in subconditions)
+                return _invalid(condition, "'all' requires a list of conditions")
+            predicates = [self._compile_condition(c) for c in _flatten_logical("all", subconditions)]
+            if len(predicates) == 1:
+                return predicates[0]
+
+            def match_all(context: dict) -> bool:
+                for predicate in predicates:
+                    if not predicate(context):
+                        return False
+                return True
+
+            return match_all
 
         if "any" in condition:
             subconditions = condition["any"]
             if not isinstance(subconditions, list):
-                raise InvalidConditionError(condition, "'any' requires a list of conditions")
-            return any(self._evaluate_condition(c, context) for c in subconditions)
+                return _invalid(condition, "'any' requires a list of conditions")
+            predicates = [self._compile_condition(c) for c in _flatten_logical("any", subconditions)]
+            if len(predicates) == 1:
+                return predicates[0]
+
+            def match_any(context: dict) -> bool:
+                for predicate in predicates:
+                    if predicate(context):
+                        return True
+                return False
+
+            return match_any
 
-        # Handle comparison/collection operators
+        # Handle comparison/collection operators (only the first key counts)
         for op_name, args in condition.items():
             if not is_operator(op_name):
-                raise InvalidConditionError(condition, f"Unknown operator: {op_name}")
+                return _invalid(condition, f"Unknown operator: {op_name}")
 
             operator = get_operator(op_name)
 
             # Handle unary operators (missing, exists)
             if op_name in ("missing", "exists"):
-                if isinstance(args, str):
-                    value = self._resolve_value(args, context)
-                elif isinstance(args, list) and len(args) >= 1:
-                    value = self._resolve_value(args[0], context)
-                else:
-                    value = args
-                return operator(value, None)
+                operand = _compile_value(args[0] if isinstance(args, list) and len(args) >= 1 else args)
+                return lambda context: operator(operand(context), None)
 
             # Handle binary operators
             if not isinstance(args, list) or len(args) < 2:
-                raise InvalidConditionError(
+                return _invalid(
                     condition,
                     f"Operator {op_name} requires a list of [left, right] operands"
                 )
 
-            left = self._resolve_value(args[0], context)
-            right = self._resolve_value(args[1], context)
-
-            return operator(left, right)
-
-        return True
-
-    def _resolve_value(self, value: Any, context: dict) -> Any:
-        """
-        Resolve a value, substituting template variables.
-
-        Args:
-            value: Value to resolve (may contain {{variable}} templates)
-            context: Context dictionary for variable substitution
-
-        Returns:
-            Resolved value
-        """
-        if not isinstance(value, str):
-            return value
-
-        # Check for template pattern
-        match = TEMPLATE_PATTERN.match(value)
-        if match:
-            var_name = match.group(1)
-            return context.get(var_name)
-
-        # Check for partial template in string
-        def replace_var(m):
-            var_name = m.group(1)
-            val = context.get(var_name, "")
-            return str(val) if val is not None else ""
+            left = _compile_value(args[0])
+            compare = NUMERIC_COMPARISONS.get(op_name)
+            bound = _numeric_constant(args[1]) if compare else None
+            if bound is not None:
+                return _bound_comparison(compare, left, bound)
 
-        if TEMPLATE_PATTERN.search(value):
-            return TEMPLATE_PATTERN.sub(replace_var, value)
+            right = _compile_value(args[1])
+            return lambda context: operator(left(context), right(context))
 
-        return value
+        return _always_true
 
 
 def create_engine_from_dict(policy: dict) -> PolicyEngine:
@@ -1,11 +1,13 @@
 """
 Policy loader utilities for loading policies from files or dictionaries.
 """
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from .engine import PolicyEngine
 from .exceptions import PolicyLoadError
 
@@ -34,9 +36,9 @@ def load_policy_from_file(path: str | Path) -> PolicyEngine:
         raise PolicyLoadError(f"Policy file must be JSON: {path}")
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            policy_dict = json.load(f)
-    except json.JSONDecodeError as e:
+        with open(path, "rb") as f:
+            policy_dict = orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
         raise PolicyLoadError(f"Invalid JSON in policy file {path}: {e}")
     except IOError as e:
         raise PolicyLoadError(f"Cannot read policy file {path}: {e}")
@@ -125,11 +127,48 @@ def get_default_policy() -> dict:
 
 _cached_engine: Optional[PolicyEngine] = None
 
+# Compiled engines per policy file, keyed by (path, mtime) so edits are picked up
+POLICY_FILE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def _load_default_engine() -> PolicyEngine:
+    """Compile the built-in default policy once."""
+    return load_policy_from_dict(get_default_policy())
+
+
+@lru_cache(maxsize=POLICY_FILE_CACHE_SIZE)
+def _load_policy_file_cached(path: str, mtime_ns: Optional[int]) -> PolicyEngine:
+    """
+    Load and compile a policy file; mtime_ns only keys the cache.
+
+    A file that fails to load falls back to the default policy, and that
+    outcome is cached too, so a broken file is read and reported once per
+    modification rather than on every evaluation.
+    """
+    try:
+        return load_policy_from_file(path)
+    except PolicyLoadError as e:
+        logger.warning(f"Failed to load policy from {path}: {e}, using default")
+        return _load_default_engine()
+
+
+def reset_policy_engine() -> None:
+    """Drop the cached engine and compiled policy files so the next call reloads."""
+    global _cached_engine
+    _cached_engine = None
+    _load_policy_file_cached.cache_clear()
+    _load_default_engine.cache_clear()
+
 
 def get_policy_engine(policy_path: Optional[str] = None, reload: bool = False) -> PolicyEngine:
     """
     Get or create the policy engine singleton.
 
+    Policy files are cached per path and modification time, so switching
+    between files reuses their compiled engines and an edited file is
+    reloaded on the next call. This is cheap enough to call per request.
+
     Args:
         policy_path: Optional path to custom policy file
         reload: Force reload even if cached
@@ -139,16 +178,15 @@ def get_policy_engine(policy_path: Optional[str] = None, reload: bool = False) -
     """
     global _cached_engine
 
-    if _cached_engine is not None and not reload:
-        return _cached_engine
+    if reload:
+        reset_policy_engine()
 
     if policy_path:
         try:
-            _cached_engine = load_policy_from_file(policy_path)
-            return _cached_engine
-        except PolicyLoadError as e:
-            logger.warning(f"Failed to load policy from {policy_path}: {e}, using default")
-
-    # Use default policy
-    _cached_engine = load_policy_from_dict(get_default_policy())
+            mtime_ns = Path(policy_path).stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None  # load_policy_from_file reports the missing file
+        _cached_engine = _load_policy_file_cached(str(policy_path), mtime_ns)
+    elif _cached_engine is None:
+        _cached_engine = _load_default_engine()
     return _cached_engine
@@ -3,40 +3,56 @@ Operators for the Policy DSL evaluation.
 
 Supports comparison, logical, and collection operators.
 """
+import operator
 import re
+from functools import lru_cache
 from typing import Any, Callable
 
 from .exceptions import InvalidOperatorError
 
 
-def _safe_compare(a: Any, b: Any, op: Callable[[Any, Any], bool]) -> bool:
-    """Safely compare two values, handling None cases."""
+# Comparisons coerce both operands to float; None or non-numeric operands never match.
+# The check is written out in each operator so a comparison is a single call.
+
+
+def op_gt(a: Any, b: Any) -> bool:
+    """Greater than operator."""
     if a is None or b is None:
         return False
     try:
-        return op(float(a), float(b))
+        return float(a) > float(b)
     except (ValueError, TypeError):
         return False
 
 
-def op_gt(a: Any, b: Any) -> bool:
-    """Greater than operator."""
-    return _safe_compare(a, b, lambda x, y: x > y)
-
-
 def op_gte(a: Any, b: Any) -> bool:
     """Greater than or equal operator."""
-    return _safe_compare(a, b, lambda x, y: x >= y)
+    if a is None or b is None:
+        return False
+    try:
+        return float(a) >= float(b)
+    except (ValueError, TypeError):
+        return False
 
 
 def op_lt(a: Any, b: Any) -> bool:
     """Less than operator."""
-    return _safe_compare(a, b, lambda x, y: x < y)
+    if a is None or b is None:
+        return False
+    try:
+        return float(a) < float(b)
+    except (ValueError, TypeError):
+        return False
 
 
 def op_lte(a: Any, b: Any) -> bool:
     """Less than or equal operator."""
-    return _safe_compare(a, b, lambda x, y: x <= y)
+    if a is None or b is None:
+        return False
+    try:
+        return float(a) <= float(b)
+    except (ValueError, TypeError):
+        return False
 
 
 def op_eq(a: Any, b: Any) -> bool:
@@ -87,12 +103,18 @@ def op_in(value: Any, collection: Any) -> bool:
     return op_includes(collection, value)
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a policy regex once; invalid patterns raise re.error on every call."""
+    return re.compile(pattern)
+
+
 def op_matches(value: Any, pattern: Any) -> bool:
     """Check if value matches regex pattern."""
     if value is None or pattern is None:
         return False
     try:
-        return bool(re.match(str(pattern), str(value)))
+        return bool(_compile_pattern(str(pattern)).match(str(value)))
     except re.error:
         return False
 
@@ -113,6 +135,16 @@ OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
 }
 
 
+# Native comparisons behind the numeric operators, used by the engine when the
+# right operand is a numeric constant it can coerce once at load time
+NUMERIC_COMPARISONS: dict[str, Callable[[float, float], bool]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
 def get_operator(name: str) -> Callable[[Any, Any], bool]:
     """Get operator function by name."""
     if name not in OPERATORS:
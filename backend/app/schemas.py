@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
@@ -18,6 +19,9 @@ MAX_SUMMARY_LENGTH = 2000
 MAX_COMPLIANCE_FLAGS = 50
 MAX_ACTOR_ID_LENGTH = 255
 
+# Safe characters for flow_id and node_id
+IDENTIFIER_RE = re.compile(r"^[\w\-\.]+$")
+
 
 class DecisionRecommendationIn(BaseModel):
     summary: Optional[str] = Field(None, max_length=MAX_SUMMARY_LENGTH)
@@ -51,8 +55,7 @@ class DecisionCreate(BaseModel):
     @classmethod
     def validate_identifier(cls, v: str) -> str:
         """Validate flow_id and node_id contain safe characters."""
-        import re
-        if not re.match(r"^[\w\-\.]+$", v):
+        if not IDENTIFIER_RE.match(v):
             raise ValueError("Must contain only alphanumeric characters, dashes, underscores, or dots")
         return v
 
@@ -147,3 +150,30 @@ class DecisionOut(BaseModel):
 class DecisionListOut(BaseModel):
     items: list[DecisionOut]
     total: int
+
+
+class DecisionRecommendationSummaryOut(BaseModel):
+    summary: Optional[str] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DecisionSummaryOut(BaseModel):
+    """Lightweight decision row for list views that skip nested detail."""
+
+    id: UUID
+    flow_id: str
+    node_id: str
+    status: DecisionStatus
+    language: str
+    risk_score: Optional[float] = None
+    confidence_score: Optional[float] = None
+    estimated_cost: Optional[float] = None
+    created_at: datetime
+    expires_at: Optional[datetime] = None
+    recommendation: Optional[DecisionRecommendationSummaryOut] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DecisionSummaryListOut(BaseModel):
+    items: list[DecisionSummaryOut]
+    total: int
@@ -3,6 +3,7 @@ Rate limiting configuration for DCP API.
 
 Uses slowapi for rate limiting based on client IP or custom keys.
 """
+import hashlib
 import logging
 from typing import Callable
 
@@ -12,6 +13,8 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from starlette.responses import JSONResponse
 
+from ..config import get_settings
+
 logger = logging.getLogger("dcp.security.rate_limit")
 
 
@@ -25,7 +28,7 @@ def get_client_identifier(request: Request) -> str:
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
         # Take the first IP in the chain (original client)
-        return forwarded.split(",")[0].strip()
+        return forwarded.partition(",")[0].strip()
 
     return get_remote_address(request)
 
@@ -39,19 +42,21 @@ def get_api_key_or_ip(request: Request) -> str:
     """
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
-        token = auth_header.split(" ", 1)[1]
-        # Use hash of token to avoid storing sensitive data
-        return f"token:{hash(token) % 10000000}"
+        token = auth_header[7:]
+        # Key by a digest of the token to avoid storing sensitive data; unlike
+        # hash() it is stable across restarts and workers and hard to collide
+        return f"token:{hashlib.blake2b(token.encode(), digest_size=8).hexdigest()}"
 
     return get_client_identifier(request)
 
 
-# Create limiter instance
+# Create limiter instance. With the default in-process storage each worker
+# counts separately; set RATE_LIMIT_STORAGE to a redis:// URI to share quotas.
 limiter = Limiter(
     key_func=get_api_key_or_ip,
     default_limits=["200 per minute"],
-    storage_uri="memory://",  # Use Redis for distributed: "redis://redis:6379"
-    strategy="fixed-window",
+    storage_uri=get_settings().rate_limit_storage_uri,
+    strategy="moving-window",
 )
 
 
@@ -5,21 +5,25 @@ Runs periodically to:
 1. Find decisions that have exceeded their expires_at time
 2. Update their status to 'expired'
 3. Publish expiration events
+4. Delete expired and revoked user sessions
 """
 import asyncio
 import logging
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from ..models import Decision
+from ..models import Decision, UserSession
 from ..events.publisher import publish_event, get_publisher
 from ..events.schemas import EventTypes
 
 logger = logging.getLogger("dcp.worker.expiration")
 
+# Expired or revoked sessions are kept this long before being deleted
+SESSION_RETENTION = timedelta(days=1)
+
 
 class ExpirationWorker:
     """
@@ -56,7 +60,7 @@ class ExpirationWorker:
         logger.info(f"Starting expiration worker with interval {self.interval}s")
 
         # Initialize event publisher
-        get_publisher(self.redis_url)
+        await get_publisher(self.redis_url).start()
 
         self._task = asyncio.create_task(self._run_loop())
 
@@ -81,6 +85,13 @@ class ExpirationWorker:
             except Exception as e:
                 logger.error(f"Error processing expired decisions: {e}")
 
+            try:
+                purged_count = await self.purge_expired_sessions()
+                if purged_count > 0:
+                    logger.info(f"Purged {purged_count} expired sessions")
+            except Exception as e:
+                logger.error(f"Error purging expired sessions: {e}")
+
             await asyncio.sleep(self.interval)
 
     async def process_expired_decisions(self) -> int:
@@ -92,7 +103,7 @@ class ExpirationWorker:
         """
         async with self.session_factory() as session:
             # Find expired decisions that are still pending
-            now = datetime.utcnow()
+            now = datetime.now(UTC)
             stmt = (
                 select(Decision)
                 .where(Decision.status == "pending_human_review")
@@ -114,6 +125,26 @@ class ExpirationWorker:
             await session.commit()
             return len(expired_decisions)
 
+    async def purge_expired_sessions(self) -> int:
+        """
+        Delete user sessions that expired or were revoked more than
+        SESSION_RETENTION ago.
+
+        Keeps the user_sessions table and its indexes limited to live rows.
+
+        Returns:
+            Number of sessions deleted
+        """
+        async with self.session_factory() as session:
+            cutoff = datetime.now(UTC) - SESSION_RETENTION
+            result = await session.execute(
+                delete(UserSession).where(
+                    or_(UserSession.expires_at < cutoff, UserSession.revoked_at < cutoff)
+                )
+            )
+            await session.commit()
+            return result.rowcount or 0
+
     async def _expire_decision(self, session: AsyncSession, decision: Decision) -> None:
         """
         Mark a single decision as expired and publish event.
@@ -124,20 +155,21 @@ class ExpirationWorker:
         """
         # Update status
         decision.status = "expired"
+        decision_id = str(decision.id)
 
         # Publish expiration event
         await publish_event(
             EventTypes.DECISION_EXPIRED,
             {
-                "decision_id": str(decision.id),
+                "decision_id": decision_id,
                 "execution_id": str(decision.execution_id),
                 "flow_id": decision.flow_id,
                 "node_id": decision.node_id,
                 "status": "expired",
                 "expires_at": decision.expires_at.isoformat() if decision.expires_at else None,
-                "expired_at": datetime.utcnow().isoformat(),
+                "expired_at": datetime.now(UTC).isoformat(),
             },
-            subject=str(decision.id),
+            subject=decision_id,
         )
 
         logger.debug(f"Decision {decision.id} marked as expired")
@@ -0,0 +1,13 @@
+-- chunk0-7: user_sessions.token_hash moves from a SHA-256 hex varchar(255)
+-- to the raw 32-byte BLAKE2b digest (bytea).
+--
+-- Old hex hashes cannot be re-keyed to the new digest, so every existing
+-- session is deleted: all users are logged out and sign in again via TAH.
+BEGIN;
+
+TRUNCATE TABLE user_sessions;
+
+ALTER TABLE user_sessions
+    ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex');
+
+COMMIT;
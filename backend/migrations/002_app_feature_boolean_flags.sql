@@ -0,0 +1,16 @@
+-- chunk0-9: app_feature.is_public / requires_org move from varchar(10)
+-- holding 'true'/'false' to native, non-null booleans.
+--
+-- The old code read a flag as set only when it equalled 'true', so the
+-- conversion uses the same test (NULL and any other value become false).
+BEGIN;
+
+ALTER TABLE app_feature
+    ALTER COLUMN is_public DROP DEFAULT,
+    ALTER COLUMN is_public TYPE boolean USING coalesce(is_public = 'true', false),
+    ALTER COLUMN is_public SET NOT NULL,
+    ALTER COLUMN requires_org DROP DEFAULT,
+    ALTER COLUMN requires_org TYPE boolean USING coalesce(requires_org = 'true', false),
+    ALTER COLUMN requires_org SET NOT NULL;
+
+COMMIT;
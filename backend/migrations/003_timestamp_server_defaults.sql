@@ -0,0 +1,23 @@
+-- chunk2-12: created_at / updated_at are filled by Postgres instead of the
+-- application. Inserts omit these columns, so existing tables need the
+-- server-side default or the NOT NULL check fails.
+BEGIN;
+
+ALTER TABLE decision
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE decision_action
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE app_feature
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+
+ALTER TABLE users
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+
+ALTER TABLE user_sessions
+    ALTER COLUMN created_at SET DEFAULT now();
+
+COMMIT;
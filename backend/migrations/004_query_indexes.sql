@@ -0,0 +1,33 @@
+-- Indexes added to models.py after the initial schema. create_all does not
+-- add indexes to tables that already exist.
+--
+-- CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so
+-- this file has no BEGIN/COMMIT: psql runs each statement on its own. Every
+-- statement is idempotent, so the file can be re-run after a failure (drop
+-- any index left INVALID by an interrupted build first).
+
+-- chunk0-14: live-session cookie lookup
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sessions_token_live
+    ON user_sessions (token_hash, expires_at) WHERE revoked_at IS NULL;
+DROP INDEX CONCURRENTLY IF EXISTS idx_sessions_token;
+
+-- chunk1-22: list_decisions (org + status filter, newest first)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decision_org_status_created
+    ON decision (org_id, status, created_at DESC);
+DROP INDEX CONCURRENTLY IF EXISTS idx_decision_org;
+
+-- chunk2-7: default inbox listing (pending decisions only)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decision_pending
+    ON decision (org_id, created_at DESC)
+    WHERE status = 'pending_human_review';
+
+-- chunk2-18: expiration worker sweep
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decision_pending_expiry
+    ON decision (expires_at)
+    WHERE status = 'pending_human_review' AND expires_at IS NOT NULL;
+
+-- chunk3-5: actions loader (decision_id IN (...) ORDER BY created_at)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decision_action_decision_created
+    ON decision_action (decision_id, created_at);
+DROP INDEX CONCURRENTLY IF EXISTS ix_decision_action_decision_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_decision_action_created_at;
@@ -0,0 +1,58 @@
+"""
+Integration tests for the app features manifest endpoints.
+"""
+import pytest
+
+from app.app_features import CACHE_NAMESPACE
+from app.cache import get_response_cache
+
+
+@pytest.fixture(autouse=True)
+async def clear_features_cache():
+    """Start every test with an empty manifest cache."""
+    await get_response_cache().clear(CACHE_NAMESPACE)
+    yield
+    await get_response_cache().clear(CACHE_NAMESPACE)
+
+
+class TestManifestStats:
+    """Tests for GET /manifest/stats and /manifest/modules endpoints."""
+
+    @pytest.mark.integration
+    async def test_stats_match_manifest(self, client):
+        """Stats should count the same features and modules as the full manifest."""
+        manifest_response = await client.get("/api/v1/app-features/manifest")
+        assert manifest_response.status_code == 200
+        manifest = manifest_response.json()
+
+        response = await client.get("/api/v1/app-features/manifest/stats")
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats == manifest["stats"]
+        assert stats["totalFeatures"] == len(manifest["features"])
+        assert stats["publicFeatures"] == sum(1 for f in manifest["features"] if f["isPublic"])
+        assert stats["totalModules"] == len(manifest["modules"])
+
+    @pytest.mark.integration
+    async def test_modules_match_manifest(self, client):
+        """Module list should carry per-module feature counts, ordered by module id."""
+        manifest = (await client.get("/api/v1/app-features/manifest")).json()
+
+        response = await client.get("/api/v1/app-features/manifest/modules")
+
+        assert response.status_code == 200
+        modules = response.json()
+        assert modules == manifest["modules"]
+        assert [m["id"] for m in modules] == sorted(m["id"] for m in modules)
+        for module in modules:
+            expected = sum(1 for f in manifest["features"] if f["module"] == module["id"])
+            assert module["featureCount"] == expected
+            assert set(module) == {"id", "name", "featureCount"}
+
+    @pytest.mark.integration
+    async def test_stats_are_public(self, client):
+        """Stats should not require authentication (TAH discovery)."""
+        response = await client.get("/api/v1/app-features/manifest/stats")
+        assert response.status_code == 200
+        assert set(response.json()) == {"totalFeatures", "totalModules", "publicFeatures"}
@@ -1,8 +1,14 @@
 """
 Integration tests for the decision API endpoints.
 """
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
 import pytest
-from uuid import uuid4
+from sqlalchemy import update
+
+from app import crud, schemas
+from app.models import Decision
 
 
 class TestCreateDecisionGate:
@@ -54,6 +60,33 @@ class TestCreateDecisionGate:
         # Should return the same decision
         assert decision_id1 == decision_id2
 
+    @pytest.mark.integration
+    async def test_create_decision_gate_taken_by_other_org(
+        self, client, async_session, auth_headers, decision_factory
+    ):
+        """Reusing another org's execution_id/node_id should return 409."""
+        execution_id = uuid4()
+        await crud.create_decision(
+            async_session,
+            schemas.DecisionCreate(
+                execution_id=execution_id,
+                flow_id="test-flow",
+                node_id="shared-node",
+                recommendation=schemas.DecisionRecommendationIn(summary="Other org"),
+            ),
+            org_id="other-org",
+        )
+
+        payload = decision_factory.create_payload(execution_id=str(execution_id), node_id="shared-node")
+        response = await client.post(
+            "/api/v2/dcp/decision-gates",
+            json=payload,
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 409
+        assert response.json() == {"detail": "A decision for this execution_id and node_id already exists"}
+
     @pytest.mark.integration
     async def test_create_decision_gate_without_policy_snapshot(self, client, auth_headers):
         """Should apply heuristic policy when no snapshot provided."""
@@ -193,6 +226,74 @@ class TestListDecisions:
         assert response.status_code == 401
 
 
+class TestListDecisionSummaries:
+    """Tests for GET /decisions/summary endpoint."""
+
+    @pytest.mark.integration
+    async def test_list_summaries_shape(self, client, auth_headers, decision_factory):
+        """Should return summary rows without nested detail."""
+        payload = decision_factory.create_payload()
+        create_response = await client.post(
+            "/api/v2/dcp/decision-gates",
+            json=payload,
+            headers=auth_headers,
+        )
+        decision_id = create_response.json()["id"]
+
+        response = await client.get(
+            "/api/v2/dcp/decisions/summary",
+            params={"limit": 200},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] >= 1
+        item = next(i for i in data["items"] if i["id"] == decision_id)
+        assert set(item) == {
+            "id",
+            "flow_id",
+            "node_id",
+            "status",
+            "language",
+            "risk_score",
+            "confidence_score",
+            "estimated_cost",
+            "created_at",
+            "expires_at",
+            "recommendation",
+        }
+        assert item["recommendation"] == {"summary": "Test recommendation"}
+        assert item["estimated_cost"] == payload["estimated_cost"]
+
+    @pytest.mark.integration
+    async def test_list_summaries_pagination(self, client, auth_headers, decision_factory):
+        """Should respect limit like GET /decisions."""
+        for i in range(3):
+            payload = decision_factory.create_payload(node_id=f"summary-node-{i}")
+            await client.post(
+                "/api/v2/dcp/decision-gates",
+                json=payload,
+                headers=auth_headers,
+            )
+
+        response = await client.get(
+            "/api/v2/dcp/decisions/summary?limit=2",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["total"] >= 3
+
+    @pytest.mark.integration
+    async def test_list_summaries_without_auth(self, client):
+        """Should return 401 without authorization."""
+        response = await client.get("/api/v2/dcp/decisions/summary")
+        assert response.status_code == 401
+
+
 class TestApproveDecision:
     """Tests for POST /decisions/{id}/approve endpoint."""
 
@@ -379,3 +480,86 @@ class TestAuthenticationNoToken:
         """Should allow requests when bearer_token is not configured."""
         response = await client_no_auth.get("/api/v2/dcp/decisions")
         assert response.status_code == 200
+
+
+class TestListDecisionsKeyset:
+    """Tests for keyset paging with before/before_id on GET /decisions."""
+
+    async def _create_at(self, client, async_session, auth_headers, decision_factory, count, created_at):
+        """Create decisions and pin them all to the same created_at."""
+        ids = []
+        for i in range(count):
+            payload = decision_factory.create_payload(node_id=f"keyset-node-{i}")
+            response = await client.post(
+                "/api/v2/dcp/decision-gates",
+                json=payload,
+                headers=auth_headers,
+            )
+            ids.append(UUID(response.json()["id"]))
+
+        await async_session.execute(
+            update(Decision).where(Decision.id.in_(ids)).values(created_at=created_at)
+        )
+        await async_session.commit()
+        return [str(i) for i in ids]
+
+    @pytest.mark.integration
+    async def test_keyset_pages_across_equal_created_at(self, client, async_session, auth_headers, decision_factory):
+        """Every row sharing a created_at should appear exactly once across pages."""
+        created_at = datetime(2001, 1, 1, tzinfo=UTC)
+        ids = await self._create_at(client, async_session, auth_headers, decision_factory, 5, created_at)
+
+        params = {"limit": 2, "before": (created_at + timedelta(seconds=1)).isoformat()}
+        seen, totals = [], []
+        while True:
+            response = await client.get("/api/v2/dcp/decisions", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            data = response.json()
+            if not data["items"]:
+                break
+            seen.extend(item["id"] for item in data["items"])
+            totals.append(data["total"])
+            last = data["items"][-1]
+            params = {"limit": 2, "before": last["created_at"], "before_id": last["id"]}
+
+        assert sorted(seen) == sorted(ids)
+        assert seen == sorted(seen, reverse=True)  # id breaks the tie, descending
+        # With a cursor, total counts the rows remaining from that cursor on
+        assert totals == [5, 3, 1]
+
+    @pytest.mark.integration
+    async def test_before_without_before_id_is_strict(self, client, async_session, auth_headers, decision_factory):
+        """A bare before cursor excludes rows created at exactly that instant."""
+        created_at = datetime(2002, 1, 1, tzinfo=UTC)
+        ids = await self._create_at(client, async_session, auth_headers, decision_factory, 2, created_at)
+
+        response = await client.get(
+            "/api/v2/dcp/decisions",
+            params={"before": created_at.isoformat()},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        returned = {item["id"] for item in response.json()["items"]}
+        assert returned.isdisjoint(ids)
+
+    @pytest.mark.integration
+    async def test_offset_past_end_still_counts(self, client, async_session, auth_headers, decision_factory):
+        """A page past the end returns no items but still reports the total."""
+        created_at = datetime(2003, 1, 1, tzinfo=UTC)
+        await self._create_at(client, async_session, auth_headers, decision_factory, 3, created_at)
+
+        response = await client.get(
+            "/api/v2/dcp/decisions",
+            params={
+                "limit": 2,
+                "offset": 50,
+                "before": (created_at + timedelta(seconds=1)).isoformat(),
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] >= 3
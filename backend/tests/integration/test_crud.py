@@ -4,6 +4,8 @@ Integration tests for CRUD operations.
 import pytest
 from uuid import uuid4
 
+from sqlalchemy.exc import InvalidRequestError
+
 from app import crud, schemas, models
 
 
@@ -144,6 +146,29 @@ class TestListDecisions:
         assert items[0].id != items2[0].id
 
 
+    @pytest.mark.integration
+    async def test_list_decisions_summary_loads_only_summary_fields(self, async_session):
+        """Summary rows should serialize as DecisionSummaryOut and leave children unloaded."""
+        payload = schemas.DecisionCreate(
+            execution_id=uuid4(),
+            flow_id="test",
+            node_id="summary-node",
+            recommendation=schemas.DecisionRecommendationIn(summary="Short"),
+        )
+        created = await crud.create_decision(async_session, payload)
+        async_session.expunge_all()
+
+        items, _ = await crud.list_decisions(async_session, limit=200, summary=True)
+        decision = next(d for d in items if d.id == created.id)
+
+        out = schemas.DecisionSummaryOut.model_validate(decision)
+        assert out.recommendation.summary == "Short"
+        with pytest.raises(InvalidRequestError):
+            decision.actions
+        with pytest.raises(InvalidRequestError):
+            decision.policy_snapshot
+
+
 class TestDecisionActions:
     """Tests for decision action CRUD operations."""
 
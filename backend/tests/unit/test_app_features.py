@@ -0,0 +1,136 @@
+"""
+Unit tests for the app feature insert statements, compiled for PostgreSQL.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app import app_features
+from app.app_features import DEFAULT_FEATURE_IDS, DEFAULT_FEATURE_ROWS, AppFeatureIn
+from app.models import AppFeature
+
+
+class FakeResult:
+    """Result stand-in for the scalar accessors the routes use."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Session stand-in that records statements and answers them in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return FakeResult(self.results.pop(0))
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture(autouse=True)
+def invalidations(monkeypatch):
+    """Record cache invalidations instead of touching the response cache."""
+    calls = []
+
+    async def record():
+        calls.append(True)
+
+    monkeypatch.setattr(app_features, "invalidate_features_cache", record)
+    return calls
+
+
+def compile_pg(stmt):
+    """Compile a statement for PostgreSQL without executing it."""
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def inserted_ids(compiled) -> list[str]:
+    """Ids bound into a multi-row INSERT, in row order."""
+    count = sum(1 for key in compiled.params if key.startswith("id_m"))
+    return [compiled.params[f"id_m{i}"] for i in range(count)]
+
+
+def feature_row(**overrides) -> AppFeature:
+    """Build an unsaved AppFeature from the first default row."""
+    values = {**DEFAULT_FEATURE_ROWS[0], **overrides}
+    return AppFeature(**values)
+
+
+class TestSeedFeatures:
+    """Tests for seed_features_internal."""
+
+    @pytest.mark.unit
+    async def test_inserts_missing_defaults_in_one_statement(self, invalidations):
+        """Only defaults not already present go into a single ON CONFLICT insert."""
+        existing = feature_row()
+        created = [feature_row(id=feature_id) for feature_id in DEFAULT_FEATURE_IDS[1:]]
+        session = RecordingSession([existing], created)
+
+        features = await app_features.seed_features_internal(session)
+
+        assert features == [existing, *created]
+        assert len(session.statements) == 2
+        compiled = compile_pg(session.statements[1])
+        assert "ON CONFLICT (id) DO NOTHING RETURNING" in str(compiled)
+        assert inserted_ids(compiled) == list(DEFAULT_FEATURE_IDS[1:])
+        assert session.commits == 1
+        assert invalidations == [True]
+
+    @pytest.mark.unit
+    async def test_skips_insert_when_all_defaults_exist(self):
+        """A fully seeded table costs one SELECT and no INSERT."""
+        existing = [feature_row(id=feature_id) for feature_id in DEFAULT_FEATURE_IDS]
+        session = RecordingSession(existing)
+
+        features = await app_features.seed_features_internal(session)
+
+        assert features == existing
+        assert len(session.statements) == 1
+
+
+class TestCreateFeature:
+    """Tests for the create_feature route."""
+
+    payload = AppFeatureIn(id="dcp.custom", name="Custom", module="custom")
+
+    @pytest.mark.unit
+    async def test_inserts_with_on_conflict(self, invalidations):
+        """A new id is inserted and returned in one round trip."""
+        session = RecordingSession([feature_row(id="dcp.custom", name="Custom", module="custom")])
+
+        out = await app_features.create_feature(self.payload, session)
+
+        assert out.id == "dcp.custom"
+        compiled = compile_pg(session.statements[0])
+        assert "ON CONFLICT (id) DO NOTHING RETURNING" in str(compiled)
+        assert compiled.params["id"] == "dcp.custom"
+        assert session.commits == 1
+        assert invalidations == [True]
+
+    @pytest.mark.unit
+    async def test_conflicting_id_returns_409(self, invalidations):
+        """An insert that returns no row means the id is taken."""
+        session = RecordingSession([])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await app_features.create_feature(self.payload, session)
+
+        assert exc_info.value.status_code == 409
+        assert exc_info.value.detail == "Feature already exists"
+        assert session.commits == 0
+        assert invalidations == []
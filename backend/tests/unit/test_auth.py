@@ -0,0 +1,117 @@
+"""
+Unit tests for the session cache in the auth module.
+"""
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app import auth
+from app import cache as cache_module
+from app.models import UserSession
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def scalar_one_or_none(self):
+        return self._row
+
+
+class FakeDB:
+    """Minimal AsyncSession stand-in that records execute calls."""
+
+    def __init__(self, row=None):
+        self.row = row
+        self.executed = 0
+        self.committed = False
+
+    async def execute(self, stmt, params=None):
+        self.executed += 1
+        return FakeResult(self.row)
+
+    async def commit(self):
+        self.committed = True
+
+
+def make_session_row(token: str, expires_in: timedelta = timedelta(hours=1)) -> UserSession:
+    return UserSession(
+        id=uuid4(),
+        user_id=uuid4(),
+        org_id="org-1",
+        token_hash=auth.hash_session_token(token),
+        tah_permissions=["decisions.read"],
+        tah_roles=["reviewer"],
+        expires_at=datetime.now(UTC) + expires_in,
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache module's clock with a manually advanced one."""
+    fake = SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def empty_session_cache():
+    auth.SESSION_CACHE.clear()
+    yield
+    auth.SESSION_CACHE.clear()
+
+
+class TestSessionCache:
+    """Tests for SESSION_CACHE use in get_current_session and logout."""
+
+    @pytest.mark.unit
+    async def test_cache_hit_skips_database(self, clock):
+        """A second lookup within the TTL is served from the cache."""
+        db = FakeDB(make_session_row("tok"))
+
+        first = await auth.get_current_session(None, "tok", db)
+        second = await auth.get_current_session(None, "tok", db)
+
+        assert second is first
+        assert db.executed == 1
+        assert "decisions.read" in second.permission_set
+
+    @pytest.mark.unit
+    async def test_cache_entry_expires_after_ttl(self, clock):
+        """After the TTL the session is re-read, so a revocation is picked up."""
+        db = FakeDB(make_session_row("tok"))
+        await auth.get_current_session(None, "tok", db)
+
+        db.row = None  # revoked by another worker
+        clock.now += auth.SESSION_CACHE.ttl
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_session(None, "tok", db)
+
+        assert exc_info.value.status_code == 401
+        assert db.executed == 2
+
+    @pytest.mark.unit
+    async def test_expired_session_not_served_from_cache(self, clock):
+        """A cached snapshot past its expires_at is not trusted."""
+        db = FakeDB(make_session_row("tok", expires_in=timedelta(seconds=-1)))
+        await auth.get_current_session(None, "tok", db)
+
+        db.row = None
+        with pytest.raises(HTTPException):
+            await auth.get_current_session(None, "tok", db)
+
+    @pytest.mark.unit
+    async def test_logout_pops_cache_entry(self, clock):
+        """Logout revokes the row and drops the local cache entry."""
+        db = FakeDB(make_session_row("tok"))
+        active = await auth.get_current_session(None, "tok", db)
+
+        await auth.logout(active, db)
+
+        assert db.committed
+        assert auth.SESSION_CACHE.get(active.token_hash) is None
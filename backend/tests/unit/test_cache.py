@@ -0,0 +1,142 @@
+"""
+Unit tests for the in-process caches.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app import cache as cache_module
+from app.cache import ResponseCache, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache module's clock with a manually advanced one."""
+    fake = SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    @pytest.mark.unit
+    def test_get_returns_value_before_expiry(self, clock):
+        """A value is returned until its TTL elapses."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        clock.now += 29
+        assert cache.get("a") == 1
+
+    @pytest.mark.unit
+    def test_get_expires_entry(self, clock):
+        """An expired value is dropped and the default returned."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        clock.now += 30
+        assert cache.get("a", "missing") == "missing"
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_set_evicts_oldest_when_full(self, clock):
+        """Inserting into a full cache evicts the oldest inserted entry."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    @pytest.mark.unit
+    def test_set_existing_key_refreshes_position(self, clock):
+        """Re-setting a key moves it to the back of the eviction order."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+
+    @pytest.mark.unit
+    def test_pop_removes_entry(self, clock):
+        """pop returns the value and removes it."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.get("a") is None
+        assert cache.pop("a", "missing") == "missing"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache without Redis (in-process fallback)."""
+
+    @pytest.mark.unit
+    async def test_get_or_set_builds_once_while_fresh(self, clock):
+        """A fresh entry is served without calling the builder again."""
+        cache = ResponseCache()
+        calls = []
+
+        async def build():
+            calls.append(1)
+            return b"payload"
+
+        assert await cache.get_or_set("ns", "k", 30, build) == b"payload"
+        clock.now += 29
+        assert await cache.get_or_set("ns", "k", 30, build) == b"payload"
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    async def test_get_or_set_rebuilds_after_ttl(self, clock):
+        """An expired entry is rebuilt and replaced."""
+        cache = ResponseCache()
+        payloads = iter([b"v1", b"v2"])
+
+        async def build():
+            return next(payloads)
+
+        assert await cache.get_or_set("ns", "k", 30, build) == b"v1"
+        clock.now += 30
+        assert await cache.get_or_set("ns", "k", 30, build) == b"v2"
+
+    @pytest.mark.unit
+    async def test_get_or_set_serves_stale_on_error(self, clock):
+        """A failed rebuild falls back to the stale payload within the grace period."""
+        cache = ResponseCache(stale_ttl=300)
+        await cache.set("ns", "k", b"old", ttl=30)
+
+        async def failing_build():
+            raise RuntimeError("database down")
+
+        clock.now += 30 + 299
+        assert await cache.get_or_set("ns", "k", 30, failing_build) == b"old"
+
+    @pytest.mark.unit
+    async def test_get_or_set_raises_past_stale_window(self, clock):
+        """Past TTL + stale_ttl the entry is gone and the rebuild error propagates."""
+        cache = ResponseCache(stale_ttl=300)
+        await cache.set("ns", "k", b"old", ttl=30)
+
+        async def failing_build():
+            raise RuntimeError("database down")
+
+        clock.now += 30 + 300
+        with pytest.raises(RuntimeError):
+            await cache.get_or_set("ns", "k", 30, failing_build)
+
+    @pytest.mark.unit
+    async def test_clear_invalidates_namespace_only(self, clock):
+        """clear drops every key in the namespace and leaves others alone."""
+        cache = ResponseCache()
+        await cache.set("features", "manifest", b"m", ttl=30)
+        await cache.set("features", "list", b"l", ttl=30)
+        await cache.set("other", "manifest", b"o", ttl=30)
+
+        await cache.clear("features")
+
+        assert await cache.get("features", "manifest") is None
+        assert await cache.get("features", "list") is None
+        assert (await cache.get("other", "manifest")).payload == b"o"
@@ -0,0 +1,177 @@
+"""
+Unit tests for the SQL that crud builds, compiled for PostgreSQL.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app import crud, main, models
+from app.schemas import DecisionActionIn, DecisionSummaryOut
+
+Row = namedtuple("Row", ["decision", "total"])
+
+
+class RecordingSession:
+    """Session stand-in that records statements and returns canned results."""
+
+    def __init__(self, rows=(), count=None):
+        self.rows = list(rows)
+        self.count = count
+        self.statements = []
+        self.gets = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self.rows
+
+        class Result:
+            def all(self):
+                return rows
+
+        return Result()
+
+    async def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.count
+
+    async def get(self, entity, ident, **kwargs):
+        self.gets.append((entity, ident, kwargs))
+        return None
+
+
+def compile_pg(stmt) -> str:
+    """Render a statement the way asyncpg would receive it, minus bound values."""
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def selected_columns(sql: str) -> set[str]:
+    """Column names in the SELECT list, ignoring the window total."""
+    select_list = sql.split(" FROM ")[0].removeprefix("SELECT ")
+    return {part.strip() for part in select_list.split(",")} - {"count(*) OVER () AS total"}
+
+
+BEFORE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class TestListDecisionsQuery:
+    """Tests for the list_decisions page query."""
+
+    @pytest.mark.unit
+    async def test_keyset_uses_row_comparison(self):
+        """created_at and id are compared as one row value so ties are not skipped."""
+        session = RecordingSession()
+        await crud.list_decisions(session, "acme", before=BEFORE, before_id=uuid4())
+
+        sql = compile_pg(session.statements[0])
+        assert "(decision.created_at, decision.id) < (%(param_1)s, %(param_2)s::UUID)" in sql
+
+    @pytest.mark.unit
+    async def test_before_without_id_filters_on_created_at(self):
+        """A bare `before` falls back to a plain timestamp comparison."""
+        session = RecordingSession()
+        await crud.list_decisions(session, "acme", before=BEFORE)
+
+        sql = compile_pg(session.statements[0])
+        assert "decision.created_at < %(created_at_1)s" in sql
+        assert "(decision.created_at, decision.id)" not in sql
+
+    @pytest.mark.unit
+    async def test_orders_newest_first_with_id_tiebreak(self):
+        """The ordering matches the keyset so pages neither overlap nor skip rows."""
+        session = RecordingSession()
+        await crud.list_decisions(session, "acme")
+
+        sql = compile_pg(session.statements[0])
+        assert "ORDER BY decision.created_at DESC, decision.id DESC" in sql
+
+    @pytest.mark.unit
+    async def test_total_comes_from_window_count(self):
+        """A non-empty page takes its total from count(*) OVER () with no extra query."""
+        decision = object()
+        session = RecordingSession(rows=[Row(decision, 42)])
+        items, total = await crud.list_decisions(session, "acme", status="pending")
+
+        assert items == [decision]
+        assert total == 42
+        assert len(session.statements) == 1
+        assert "count(*) OVER () AS total" in compile_pg(session.statements[0])
+
+    @pytest.mark.unit
+    async def test_empty_first_page_skips_count(self):
+        """No rows at offset 0 means there is nothing to count."""
+        session = RecordingSession(count=99)
+        assert await crud.list_decisions(session, "acme") == ([], 0)
+        assert len(session.statements) == 1
+
+    @pytest.mark.unit
+    async def test_page_past_the_end_counts_separately(self):
+        """An empty page beyond the end runs a count with the same filters."""
+        session = RecordingSession(count=7)
+        result = await crud.list_decisions(
+            session, "acme", status="pending", offset=20, before=BEFORE, before_id=uuid4()
+        )
+
+        assert result == ([], 7)
+        page_sql, count_sql = (compile_pg(stmt) for stmt in session.statements)
+        assert count_sql.startswith("SELECT count(*) AS count_1 FROM decision WHERE")
+        assert page_sql.split(" WHERE ")[1].startswith(count_sql.split(" WHERE ")[1])
+
+
+class TestDecisionSummaryQuery:
+    """Tests for the column list loaded by /decisions/summary."""
+
+    @pytest.mark.unit
+    async def test_loads_only_summary_columns(self):
+        """summary=True selects exactly what DecisionSummaryOut renders."""
+        session = RecordingSession()
+        await crud.list_decisions(session, "acme", summary=True)
+
+        expected = {f"decision.{name}" for name in DecisionSummaryOut.model_fields if name != "recommendation"}
+        expected |= {"decision_recommendation_1.decision_id", "decision_recommendation_1.summary"}
+        assert selected_columns(compile_pg(session.statements[0])) == expected
+
+    @pytest.mark.unit
+    async def test_skips_detail_joins(self):
+        """The summary page does not join the policy snapshot or load actions."""
+        session = RecordingSession()
+        await crud.list_decisions(session, "acme", summary=True)
+
+        sql = compile_pg(session.statements[0])
+        assert "decision_policy_snapshot" not in sql
+        assert "decision_action" not in sql
+
+
+class TestApplyActionLookup:
+    """Tests for how apply_action loads the decision it acts on."""
+
+    action = DecisionActionIn(actor_type="human", actor_id="user-1")
+
+    @pytest.mark.unit
+    async def test_get_refreshes_identity_map(self):
+        """The decision is loaded by UUID with detail options applied even if already cached."""
+        session = RecordingSession()
+        decision_id = uuid4()
+
+        with pytest.raises(ValueError):
+            await crud.apply_action(session, decision_id, "approve", self.action)
+
+        entity, ident, kwargs = session.gets[0]
+        assert entity is models.Decision
+        assert ident == decision_id
+        assert kwargs["options"] == crud.DECISION_DETAIL_OPTIONS
+        assert kwargs["populate_existing"] is True
+
+    @pytest.mark.unit
+    async def test_malformed_id_is_404_at_route(self):
+        """The route converts the path id and reports a malformed one as not found."""
+        session = RecordingSession()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await main.apply_decision_action(session, "not-a-uuid", "approve", self.action)
+
+        assert exc_info.value.status_code == 404
+        assert session.gets == []
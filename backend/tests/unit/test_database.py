@@ -0,0 +1,85 @@
+"""
+Unit tests for database startup helpers.
+"""
+import logging
+
+import pytest
+
+from app import database
+
+
+class FakeConnection:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        return None
+
+
+class FakeEngine:
+    """Engine stand-in that counts connects and optionally fails them."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        if self.fail:
+            raise OSError("connection refused")
+        return FakeConnection()
+
+
+def use_settings(monkeypatch, **overrides):
+    monkeypatch.setattr(database, "settings", database.settings.model_copy(update=overrides))
+
+
+class TestWarmUpPool:
+    """Tests for warm_up_pool."""
+
+    @pytest.mark.unit
+    async def test_opens_configured_warmup_connections(self, monkeypatch):
+        """Only db_pool_warmup connections are opened, not the whole pool."""
+        engine = FakeEngine()
+        monkeypatch.setattr(database, "engine", engine)
+        use_settings(monkeypatch, db_pool_size=20, db_pool_warmup=4)
+
+        await database.warm_up_pool()
+
+        assert engine.connects == 4
+
+    @pytest.mark.unit
+    async def test_warmup_capped_at_pool_size(self, monkeypatch):
+        """Warm-up never opens more connections than the pool keeps."""
+        engine = FakeEngine()
+        monkeypatch.setattr(database, "engine", engine)
+        use_settings(monkeypatch, db_pool_size=2, db_pool_warmup=10)
+
+        await database.warm_up_pool()
+
+        assert engine.connects == 2
+
+    @pytest.mark.unit
+    async def test_skipped_without_pool(self, monkeypatch):
+        """NullPool (db_pool_size=0) and db_pool_warmup=0 skip warm-up."""
+        engine = FakeEngine()
+        monkeypatch.setattr(database, "engine", engine)
+        use_settings(monkeypatch, db_pool_size=0, db_pool_warmup=4)
+
+        await database.warm_up_pool()
+
+        assert engine.connects == 0
+
+    @pytest.mark.unit
+    async def test_unreachable_database_does_not_raise(self, monkeypatch, caplog):
+        """A database outage during startup is logged, not raised."""
+        monkeypatch.setattr(database, "engine", FakeEngine(fail=True))
+        use_settings(monkeypatch, db_pool_size=20, db_pool_warmup=4)
+
+        with caplog.at_level(logging.WARNING, logger="dcp.database"):
+            await database.warm_up_pool()
+
+        assert any("opened 0 of 4" in r.getMessage() for r in caplog.records)
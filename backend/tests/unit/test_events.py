@@ -0,0 +1,179 @@
+"""
+Unit tests for the background event drain.
+"""
+import asyncio
+import logging
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.events import publisher as publisher_module
+from app.events.publisher import (
+    EventPublisher,
+    LogEventPublisher,
+    RedisEventPublisher,
+    publish_event,
+    start_event_drain,
+    stop_event_drain,
+)
+from app.events.schemas import create_cloud_event
+
+
+class RecordingPublisher(EventPublisher):
+    """Publisher that records each batch it is handed."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+        self.inline = []
+
+    async def publish(self, event):
+        self.inline.append(event)
+
+    async def publish_many(self, events):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.batches.append(list(events))
+
+    async def close(self):
+        pass
+
+    @property
+    def published(self):
+        return [event for batch in self.batches for event in batch]
+
+
+@pytest.fixture(autouse=True)
+async def stopped_drain():
+    """Make sure no drain task leaks between tests."""
+    yield
+    await stop_event_drain()
+
+
+class TestEventDrain:
+    """Tests for start_event_drain / publish_event / stop_event_drain."""
+
+    @pytest.mark.unit
+    async def test_queued_events_are_published_in_batches(self):
+        """Events queued before the drain runs go out in EVENT_BATCH_SIZE batches."""
+        recorder = RecordingPublisher()
+        start_event_drain(recorder)
+
+        for i in range(250):
+            await publish_event("dcp.test", {"n": i})
+        await stop_event_drain()
+
+        assert [len(batch) for batch in recorder.batches] == [100, 100, 50]
+        assert [event.data["n"] for event in recorder.published] == list(range(250))
+        assert recorder.inline == []
+
+    @pytest.mark.unit
+    async def test_full_queue_drops_events(self, monkeypatch, caplog):
+        """Events beyond EVENT_QUEUE_SIZE are dropped with a warning instead of blocking."""
+        monkeypatch.setattr(publisher_module, "EVENT_QUEUE_SIZE", 2)
+        recorder = RecordingPublisher()
+        start_event_drain(recorder)
+
+        with caplog.at_level(logging.WARNING, logger="dcp.events"):
+            for i in range(5):
+                await publish_event("dcp.test", {"n": i})
+        await stop_event_drain()
+
+        assert [event.data["n"] for event in recorder.published] == [0, 1]
+        dropped = [r for r in caplog.records if "Event queue full" in r.getMessage()]
+        assert len(dropped) == 3
+
+    @pytest.mark.unit
+    async def test_stop_flushes_pending_events(self):
+        """stop_event_drain waits for in-flight batches to finish publishing."""
+        recorder = RecordingPublisher(delay=0.01)
+        start_event_drain(recorder)
+
+        for i in range(3):
+            await publish_event("dcp.test", {"n": i})
+        await stop_event_drain()
+
+        assert len(recorder.published) == 3
+
+    @pytest.mark.unit
+    async def test_stop_gives_up_after_timeout(self, monkeypatch, caplog):
+        """A stuck backend delays shutdown by at most EVENT_DRAIN_TIMEOUT_SECONDS."""
+        monkeypatch.setattr(publisher_module, "EVENT_DRAIN_TIMEOUT_SECONDS", 0.05)
+        recorder = RecordingPublisher(delay=60)
+        start_event_drain(recorder)
+
+        await publish_event("dcp.test", {"n": 0})
+        with caplog.at_level(logging.WARNING, logger="dcp.events"):
+            await asyncio.wait_for(stop_event_drain(), timeout=1)
+
+        assert recorder.published == []
+        assert any("shutdown wait" in r.getMessage() for r in caplog.records)
+
+    @pytest.mark.unit
+    async def test_publish_goes_inline_after_stop(self):
+        """Once the drain is stopped, publish_event publishes directly."""
+        recorder = RecordingPublisher()
+        start_event_drain(recorder)
+        await stop_event_drain()
+
+        await publish_event("dcp.test", {"n": 0}, publisher=recorder)
+
+        assert recorder.batches == []
+        assert len(recorder.inline) == 1
+
+
+class TestLogEventPublisher:
+    """Tests for the log publisher's output format."""
+
+    @pytest.mark.unit
+    async def test_publish_many_logs_one_record_per_event(self, caplog):
+        """Batches should log exactly what publishing each event would."""
+        events = [
+            create_cloud_event("dcp.decision.paused", {"n": 0}),
+            create_cloud_event("dcp.decision.paused", {"n": 1}),
+            create_cloud_event("dcp.decision.actioned", {"n": 2}),
+        ]
+        publisher = LogEventPublisher()
+
+        with caplog.at_level(logging.INFO, logger="dcp.events"):
+            for event in events:
+                await publisher.publish(event)
+            single = [r.getMessage() for r in caplog.records]
+            caplog.clear()
+            await publisher.publish_many(events)
+            batched = [r.getMessage() for r in caplog.records]
+
+        assert batched == single
+        assert batched[0] == f"EVENT dcp.decision.paused: {events[0].to_json_bytes().decode()}"
+
+
+class TestRedisEventPublisherStart:
+    """Tests for the eager connect in RedisEventPublisher.start."""
+
+    @pytest.mark.unit
+    async def test_connection_error_is_logged_not_raised(self, monkeypatch, caplog):
+        """A Redis that is down at startup is reported and retried on publish."""
+        async def refuse():
+            raise RedisConnectionError("connection refused")
+
+        publisher = RedisEventPublisher("redis://localhost:6379")
+        monkeypatch.setattr(publisher, "_ensure_connected", refuse)
+
+        with caplog.at_level(logging.WARNING, logger="dcp.events"):
+            await publisher.start()
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Redis publisher connect failed; will retry on publish"
+        assert record.exc_info is not None
+
+    @pytest.mark.unit
+    async def test_unexpected_error_propagates(self, monkeypatch):
+        """Errors other than connection failures are not swallowed."""
+        async def broken():
+            raise RuntimeError("bug")
+
+        publisher = RedisEventPublisher("redis://localhost:6379")
+        monkeypatch.setattr(publisher, "_ensure_connected", broken)
+
+        with pytest.raises(RuntimeError):
+            await publisher.start()
@@ -0,0 +1,178 @@
+"""
+Unit tests for structured logging.
+"""
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from logging.handlers import QueueHandler
+
+import orjson
+import pytest
+
+from app.observability import logging as dcp_logging
+from app.observability.logging import DCPJsonFormatter, LogContext, LogContextFilter, setup_logging
+
+
+def make_record(msg="hello %s", args=("world",), exc_info=None, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("dcp.test", logging.INFO, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestDCPJsonFormatter:
+    """Tests for the orjson log formatter."""
+
+    @pytest.mark.unit
+    def test_standard_fields(self):
+        """Each record should render the standard fields with the formatted message."""
+        line = DCPJsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z").format(make_record())
+        data = orjson.loads(line)
+
+        assert data["message"] == "hello world"
+        assert data["level"] == "INFO"
+        assert data["logger"] == data["name"] == "dcp.test"
+        assert data["service"] == "dcp"
+        assert "timestamp" in data
+
+    @pytest.mark.unit
+    def test_extra_fields_only(self):
+        """Fields passed via extra should be included, built-in record attributes not."""
+        record = make_record(trace_id="t-1", decision_id="d-1")
+        data = orjson.loads(DCPJsonFormatter().format(record))
+
+        assert data["trace_id"] == "t-1"
+        assert data["decision_id"] == "d-1"
+        for attr in ("args", "msg", "levelno", "pathname", "thread", "created"):
+            assert attr not in data
+
+    @pytest.mark.unit
+    def test_non_json_values_are_stringified(self):
+        """Values orjson cannot encode natively should fall back to str()."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        record = make_record(when=when, obj={1, 2})
+        data = orjson.loads(DCPJsonFormatter().format(record))
+
+        assert data["when"] == "2024-01-02T03:04:05Z"
+        assert data["obj"] == str({1, 2})
+
+    @pytest.mark.unit
+    def test_exception_info(self):
+        """exc_info should be rendered as a formatted traceback."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+        data = orjson.loads(DCPJsonFormatter().format(record))
+
+        assert "ValueError: boom" in data["exc_info"]
+
+
+def context_fields(**extra) -> dict:
+    """Return the LogContext fields LogContextFilter would add to a fresh record."""
+    record = make_record(**extra)
+    before = set(record.__dict__)
+    LogContextFilter().filter(record)
+    return {k: v for k, v in record.__dict__.items() if k not in before or k in extra}
+
+
+class TestLogContext:
+    """Tests for LogContext and LogContextFilter."""
+
+    @pytest.mark.unit
+    def test_fields_applied_inside_context_only(self):
+        """Fields should be added inside the block and gone after it."""
+        with LogContext(decision_id="d-1"):
+            assert context_fields() == {"decision_id": "d-1"}
+        assert context_fields() == {}
+
+    @pytest.mark.unit
+    def test_nested_contexts_merge_and_restore(self):
+        """Inner contexts should extend the outer one and restore it on exit."""
+        with LogContext(flow_id="f-1", decision_id="d-1"):
+            with LogContext(decision_id="d-2"):
+                assert context_fields() == {"flow_id": "f-1", "decision_id": "d-2"}
+            assert context_fields() == {"flow_id": "f-1", "decision_id": "d-1"}
+
+    @pytest.mark.unit
+    def test_explicit_extra_wins(self):
+        """A field passed via extra should not be overwritten by the context."""
+        with LogContext(decision_id="from-context"):
+            assert context_fields(decision_id="explicit") == {"decision_id": "explicit"}
+
+    @pytest.mark.unit
+    async def test_context_isolated_between_tasks(self):
+        """Concurrent tasks should each see only their own context."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(decision_id: str) -> dict:
+            with LogContext(decision_id=decision_id):
+                if decision_id == "a":
+                    started.set()
+                    await release.wait()
+                else:
+                    await started.wait()
+                    release.set()
+                return context_fields()
+
+        results = await asyncio.gather(handler("a"), handler("b"))
+
+        assert results == [{"decision_id": "a"}, {"decision_id": "b"}]
+        assert context_fields() == {}
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Undo setup_logging: stop its listener and restore the root handlers."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    listener = dcp_logging._listener
+    if listener is not None and listener._thread is not None:
+        listener.stop()
+    dcp_logging._listener = None
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestQueuedLogging:
+    """Tests for the QueueHandler/QueueListener setup."""
+
+    @pytest.mark.unit
+    def test_root_logs_through_queue(self, restore_root_logger, tmp_path):
+        """The root logger should only enqueue; the listener thread writes."""
+        setup_logging(log_file=str(tmp_path / "dcp.log"))
+
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], QueueHandler)
+        assert dcp_logging._listener._thread is not None
+
+    @pytest.mark.unit
+    def test_records_written_with_context_after_flush(self, restore_root_logger, tmp_path):
+        """Records keep the LogContext active when logged and reach the file on stop."""
+        log_file = tmp_path / "dcp.log"
+        setup_logging(log_file=str(log_file))
+
+        with LogContext(decision_id="d-1"):
+            logging.getLogger("dcp.test").info("queued %s", "message")
+        dcp_logging._listener.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 1
+        data = orjson.loads(lines[0])
+        assert data["message"] == "queued message"
+        assert data["decision_id"] == "d-1"
+
+    @pytest.mark.unit
+    def test_setup_again_replaces_listener(self, restore_root_logger, tmp_path):
+        """Calling setup_logging again should stop the previous listener thread."""
+        setup_logging(log_file=str(tmp_path / "first.log"))
+        first = dcp_logging._listener
+
+        setup_logging(log_file=str(tmp_path / "second.log"))
+
+        assert first._thread is None
+        assert dcp_logging._listener is not first
+        assert len(logging.getLogger().handlers) == 1
@@ -0,0 +1,17 @@
+"""
+Unit tests for the request metrics middleware configuration.
+"""
+import pytest
+
+from app.main import app
+from app.observability.middleware import METRICS_SKIP_PATHS
+
+
+class TestMetricsSkipPaths:
+    """Tests for the paths excluded from request metrics."""
+
+    @pytest.mark.unit
+    def test_skips_docs_and_schema_paths(self):
+        """The docs pages and the OpenAPI schema the app serves are not measured."""
+        assert {app.docs_url, app.redoc_url, app.openapi_url} <= METRICS_SKIP_PATHS
+
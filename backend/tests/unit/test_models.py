@@ -0,0 +1,47 @@
+"""
+Unit tests for model helpers.
+"""
+import time
+import uuid
+
+import pytest
+
+from app.models import uuid7
+
+
+class TestUuid7:
+    """Tests for the uuid7 primary key generator."""
+
+    @pytest.mark.unit
+    def test_version_and_variant_bits(self):
+        """Generated ids should be RFC 9562 version 7 with the RFC 4122 variant."""
+        for _ in range(100):
+            value = uuid7()
+            assert value.version == 7
+            assert value.variant == uuid.RFC_4122
+
+    @pytest.mark.unit
+    def test_embeds_current_unix_millis(self):
+        """The leading 48 bits should be the creation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    @pytest.mark.unit
+    def test_ids_sort_by_creation_time(self):
+        """Ids generated in later milliseconds should sort after earlier ones."""
+        ids = []
+        for _ in range(5):
+            ids.append(uuid7())
+            time.sleep(0.002)
+
+        assert ids == sorted(ids)
+        assert [str(i) for i in ids] == sorted(str(i) for i in ids)
+
+    @pytest.mark.unit
+    def test_ids_are_unique(self):
+        """Random bits should keep ids unique within the same millisecond."""
+        ids = {uuid7() for _ in range(10_000)}
+        assert len(ids) == 10_000
@@ -1,8 +1,14 @@
 """
 Unit tests for the policy evaluation logic.
 """
+import os
+
+import orjson
 import pytest
-from app.policy import evaluate_policy
+
+import app.policy as policy_module
+import app.policy.loader as loader_module
+from app.policy import PolicyEngine, clear_policy_cache, evaluate_policy
 
 
 class TestEvaluatePolicy:
@@ -265,3 +271,124 @@ class TestEvaluatePolicy:
         assert "result" in result
         assert "reason" in result
         assert result["result"] in ["auto_approve", "require_human", "force_escalation"]
+
+    @pytest.mark.unit
+    def test_repeated_inputs_return_independent_results(self):
+        """Cached results should be equal but safe for callers to mutate."""
+        first = evaluate_policy(
+            risk_score=0.9,
+            confidence_score=0.5,
+            estimated_cost=100,
+            compliance_flags=["aml"],
+        )
+        first["result"] = "mutated"
+        second = evaluate_policy(
+            risk_score=0.9,
+            confidence_score=0.5,
+            estimated_cost=100,
+            compliance_flags=["aml"],
+        )
+        assert second["result"] == "force_escalation"
+
+
+class TestPolicyEngine:
+    """Tests for the compiled PolicyEngine."""
+
+    @pytest.mark.unit
+    def test_malformed_rule_is_reported_and_skipped(self):
+        """A malformed rule compiles, errors only when evaluated, and later rules still match."""
+        engine = PolicyEngine({
+            "rules": [
+                {"id": "broken", "when": {"unknown_op": [1, 2]}, "then": {"result": "auto_approve"}},
+                {
+                    "id": "low-risk",
+                    "when": {"all": [{"lte": ["{{risk_score}}", 0.2]}, {"missing": ["{{estimated_cost}}"]}]},
+                    "then": {"result": "auto_approve", "reason": "Low risk"},
+                },
+            ],
+        })
+        result = engine.evaluate({"risk_score": 0.1, "estimated_cost": None})
+        assert result.matched_rule_id == "low-risk"
+        assert result.evaluated_rules[0]["id"] == "broken"
+        assert "error" in result.evaluated_rules[0]
+
+
+@pytest.fixture
+def fresh_policy_cache():
+    """Clear memoized engines and results around a test."""
+    clear_policy_cache()
+    yield
+    clear_policy_cache()
+
+
+class TestPolicyCache:
+    """Tests for memoized evaluate_policy results."""
+
+    @pytest.mark.unit
+    def test_engine_failure_is_not_cached(self, monkeypatch, fresh_policy_cache):
+        """A failed engine evaluation falls back once without pinning the fallback."""
+        def broken_engine(*args):
+            raise RuntimeError("engine unavailable")
+
+        engine = PolicyEngine({"rules": [], "default": {"result": "force_escalation", "reason": "Custom"}})
+
+        monkeypatch.setattr(policy_module, "get_policy_engine", broken_engine)
+        fallback = evaluate_policy(risk_score=0.5, confidence_score=0.5, estimated_cost=10, compliance_flags=None)
+        assert fallback["result"] == "require_human"
+
+        monkeypatch.setattr(policy_module, "get_policy_engine", lambda *args: engine)
+        result = evaluate_policy(risk_score=0.5, confidence_score=0.5, estimated_cost=10, compliance_flags=None)
+        assert result == {"result": "force_escalation", "reason": "Custom"}
+
+    @pytest.mark.unit
+    def test_clear_policy_cache_drops_results(self, monkeypatch, fresh_policy_cache):
+        """clear_policy_cache forgets memoized results."""
+        engine = PolicyEngine({"rules": [], "default": {"result": "auto_approve", "reason": "Default"}})
+        calls = []
+        evaluate = engine.evaluate
+        monkeypatch.setattr(engine, "evaluate", lambda context: calls.append(context) or evaluate(context))
+        monkeypatch.setattr(policy_module, "get_policy_engine", lambda *args: engine)
+
+        evaluate_policy(0.5, 0.5, 10, None)
+        evaluate_policy(0.5, 0.5, 10, None)
+        assert len(calls) == 1
+
+        clear_policy_cache()
+        evaluate_policy(0.5, 0.5, 10, None)
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_edited_policy_file_is_picked_up(self, monkeypatch, tmp_path, fresh_policy_cache):
+        """Rewriting the POLICY_PATH file changes the next evaluation."""
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_bytes(orjson.dumps({"rules": [], "default": {"result": "auto_approve", "reason": "v1"}}))
+        monkeypatch.setattr(policy_module.get_settings(), "policy_path", str(policy_file))
+
+        assert evaluate_policy(0.5, 0.5, 10, None) == {"result": "auto_approve", "reason": "v1"}
+
+        policy_file.write_bytes(orjson.dumps({"rules": [], "default": {"result": "force_escalation", "reason": "v2"}}))
+        stat = policy_file.stat()
+        os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert evaluate_policy(0.5, 0.5, 10, None) == {"result": "force_escalation", "reason": "v2"}
+
+    @pytest.mark.unit
+    def test_broken_policy_file_is_read_once_per_modification(self, monkeypatch, tmp_path, fresh_policy_cache):
+        """An unloadable policy file falls back to the default without re-reading it per call."""
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_bytes(b"{not json")
+        monkeypatch.setattr(policy_module.get_settings(), "policy_path", str(policy_file))
+        reads = []
+        load = loader_module.load_policy_from_file
+        monkeypatch.setattr(loader_module, "load_policy_from_file", lambda path: reads.append(path) or load(path))
+
+        assert evaluate_policy(0.5, 0.5, 10, None)["result"] == "require_human"
+        assert evaluate_policy(0.9, 0.5, 10, None)["result"] == "force_escalation"
+        assert len(reads) == 1
+
+        policy_file.write_bytes(orjson.dumps({"rules": [], "default": {"result": "auto_approve", "reason": "Fixed"}}))
+        stat = policy_file.stat()
+        os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert evaluate_policy(0.9, 0.5, 10, None) == {"result": "auto_approve", "reason": "Fixed"}
+        assert len(reads) == 2
@@ -13,6 +13,7 @@ from app.schemas import (
     DecisionRecommendationIn,
     DecisionPolicySnapshotIn,
     DecisionOut,
+    DecisionSummaryOut,
 )
 
 
@@ -244,3 +245,43 @@ class TestDecisionPolicySnapshotIn:
         data = DecisionPolicySnapshotIn()
         assert data.policy_version is None
         assert data.result is None
+
+
+class TestDecisionSummaryOut:
+    """Tests for the summary list item schema."""
+
+    @pytest.mark.unit
+    def test_reads_summary_attributes(self):
+        """Summary rows serialize from ORM-style attributes with a nested summary."""
+        class Recommendation:
+            summary = "Looks fine"
+
+        class Decision:
+            id = uuid4()
+            flow_id = "test-flow"
+            node_id = "test-node"
+            status = "pending"
+            language = "en"
+            risk_score = 0.3
+            confidence_score = None
+            estimated_cost = None
+            created_at = datetime(2024, 1, 1)
+            expires_at = None
+            recommendation = Recommendation()
+
+        out = DecisionSummaryOut.model_validate(Decision())
+        assert out.recommendation.summary == "Looks fine"
+        assert "policy_snapshot" not in out.model_dump()
+
+    @pytest.mark.unit
+    def test_recommendation_is_optional(self):
+        """Decisions without a recommendation still serialize."""
+        out = DecisionSummaryOut(
+            id=uuid4(),
+            flow_id="test-flow",
+            node_id="test-node",
+            status="pending",
+            language="en",
+            created_at=datetime(2024, 1, 1),
+        )
+        assert out.recommendation is None